@@ -4,37 +4,70 @@ This package contains the business logic and domain models that are
 completely independent of any UI or infrastructure concerns.
 """
 
-from imthedev.core.domain import (
-    Command,
-    CommandResult,
-    CommandStatus,
-    Project,
-    ProjectContext,
-    ProjectSettings,
-)
-from imthedev.core.events import (
-    Event,
-    EventBus,
-    EventHandler,
-    EventPriority,
-    EventTypes,
-    ScopedEventBus,
-)
-from imthedev.core.interfaces import (
-    AIModel,
-    AIOrchestrator,
-    ApplicationState,
-    CommandAnalysis,
-    CommandEngine,
-    ContextService,
-    ProjectService,
-    StateManager,
-)
-from imthedev.core.services import (
-    AIOrchestratorImpl,
-    CommandEngineImpl,
-    StateManagerImpl,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from imthedev.core.domain import (
+        Command,
+        CommandResult,
+        CommandStatus,
+        Project,
+        ProjectContext,
+        ProjectSettings,
+    )
+    from imthedev.core.events import (
+        Event,
+        EventBus,
+        EventHandler,
+        EventPriority,
+        EventTypes,
+        ScopedEventBus,
+    )
+    from imthedev.core.interfaces import (
+        AIModel,
+        AIOrchestrator,
+        ApplicationState,
+        CommandAnalysis,
+        CommandEngine,
+        ContextService,
+        ProjectService,
+        StateManager,
+    )
+    from imthedev.core.services import (
+        AIOrchestratorImpl,
+        CommandEngineImpl,
+        StateManagerImpl,
+    )
+
+# Re-exported names and the module defining each. They are resolved on first
+# access so that importing a leaf module such as imthedev.core.domain does
+# not also import the event bus, the services and their SDK dependencies.
+_EXPORTS = {
+    "Command": "imthedev.core.domain",
+    "CommandResult": "imthedev.core.domain",
+    "CommandStatus": "imthedev.core.domain",
+    "Project": "imthedev.core.domain",
+    "ProjectContext": "imthedev.core.domain",
+    "ProjectSettings": "imthedev.core.domain",
+    "Event": "imthedev.core.events",
+    "EventBus": "imthedev.core.events",
+    "EventHandler": "imthedev.core.events",
+    "EventPriority": "imthedev.core.events",
+    "EventTypes": "imthedev.core.events",
+    "ScopedEventBus": "imthedev.core.events",
+    "AIModel": "imthedev.core.interfaces",
+    "AIOrchestrator": "imthedev.core.interfaces",
+    "ApplicationState": "imthedev.core.interfaces",
+    "CommandAnalysis": "imthedev.core.interfaces",
+    "CommandEngine": "imthedev.core.interfaces",
+    "ContextService": "imthedev.core.interfaces",
+    "ProjectService": "imthedev.core.interfaces",
+    "StateManager": "imthedev.core.interfaces",
+    "AIOrchestratorImpl": "imthedev.core.services",
+    "CommandEngineImpl": "imthedev.core.services",
+    "StateManagerImpl": "imthedev.core.services",
+}
 
 __all__ = [
     # Domain models
@@ -65,3 +98,18 @@ __all__ = [
     "CommandEngineImpl",
     "StateManagerImpl",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a re-exported name from its defining module on first access."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes including the lazily imported re-exports."""
+    return sorted({*globals(), *_EXPORTS})
@@ -8,9 +8,27 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 from uuid import UUID, uuid4
 
+_T = TypeVar("_T")
+
+
+def _identity_eq(cls: type[_T]) -> type[_T]:
+    """Short-circuit the generated dataclass ``__eq__`` on identity.
+
+    Results and commands are usually compared against the very object that
+    was stored, so checking identity first skips the field-by-field compare.
+    """
+    field_eq = cls.__eq__
+
+    def __eq__(self: _T, other: object) -> bool:
+        return self is other or field_eq(self, other)
+
+    __eq__.__qualname__ = f"{cls.__qualname__}.__eq__"
+    cls.__eq__ = __eq__  # type: ignore[method-assign,assignment]
+    return cls
+
 
 class CommandStatus(Enum):
     """Represents the lifecycle status of a command."""
@@ -24,7 +42,8 @@ class CommandStatus(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+@_identity_eq
+@dataclass(slots=True)
 class CommandResult:
     """Represents the result of an executed command."""
 
@@ -35,7 +54,8 @@ class CommandResult:
     timestamp: datetime = field(default_factory=datetime.now)
 
 
-@dataclass
+@_identity_eq
+@dataclass(slots=True)
 class Command:
     """Represents a command proposed by the AI for execution.
 
@@ -58,7 +78,7 @@ class Command:
     timestamp: datetime = field(default_factory=datetime.now)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectContext:
     """Maintains the execution context and history for a project.
 
@@ -75,7 +95,7 @@ class ProjectContext:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectSettings:
     """Configuration settings for a project.
 
@@ -92,7 +112,7 @@ class ProjectSettings:
     environment_vars: dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class Project:
     """Represents an AI-driven project managed by imthedev.
 
@@ -4,6 +4,7 @@ This module defines all event types used throughout the application,
 organized by domain and lifecycle stage.
 """
 
+from functools import cache
 from typing import Final
 
 
@@ -91,6 +92,12 @@ class EventTypes:
             if isinstance(value, str) and not name.startswith("_")
         ]
 
+    @classmethod
+    @cache
+    def _event_set(cls) -> frozenset[str]:
+        """Get all event types as a set, built once per class."""
+        return frozenset(cls.all_events())
+
     @classmethod
     def is_valid_event(cls, event_type: str) -> bool:
         """Check if an event type is valid.
@@ -101,7 +108,7 @@ class EventTypes:
         Returns:
             True if the event type is defined
         """
-        return event_type in cls.all_events()
+        return event_type in cls._event_set()
 
     @classmethod
     def get_domain(cls, event_type: str) -> str:
@@ -4,9 +4,11 @@ Core domain models representing objectives, steps, results, and analysis
 in the dual-AI orchestration workflow.
 """
 
+import re
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 from uuid import UUID, uuid4
@@ -287,6 +289,13 @@ class OrchestrationContext:
     current_step: int = 0
     total_steps: int = 0
     metadata: dict[str, Any] = field(default_factory=dict)
+    _pattern_set: set[str] = field(
+        default_factory=set, init=False, repr=False, compare=False
+    )
+    
+    def __post_init__(self) -> None:
+        """Index any learned patterns passed to the constructor."""
+        self._pattern_set.update(self.learned_patterns)
     
     def add_command(self, command: str, success: bool = True) -> None:
         """Add a command to history."""
@@ -308,8 +317,10 @@ class OrchestrationContext:
     
     def add_learned_pattern(self, pattern: str) -> None:
         """Add a learned pattern."""
-        if pattern not in self.learned_patterns:
-            self.learned_patterns.append(pattern)
+        if pattern in self._pattern_set:
+            return
+        self._pattern_set.add(pattern)
+        self.learned_patterns.append(pattern)
     
     @property
     def success_rate(self) -> float:
@@ -344,17 +355,51 @@ class Pattern:
     
     def matches(self, objective: str) -> bool:
         """Check if pattern matches an objective."""
-        import re
-        return bool(re.search(self.trigger, objective, re.IGNORECASE))
+        return _compile_trigger(self.trigger).search(objective) is not None
     
     def use(self) -> None:
         """Mark pattern as used."""
         self.usage_count += 1
         self.last_used = datetime.now()
+        self._reliability = None
     
     @property
     def reliability_score(self) -> float:
         """Calculate pattern reliability score."""
-        # Combine success rate with usage count for reliability
-        usage_factor = min(self.usage_count / 10, 1.0)  # Cap at 10 uses
-        return self.success_rate * 0.7 + usage_factor * 0.3
\ No newline at end of file
+        if self._reliability is None:
+            # Combine success rate with usage count for reliability
+            usage_factor = min(self.usage_count / 10, 1.0)  # Cap at 10 uses
+            self._reliability = self.success_rate * 0.7 + usage_factor * 0.3
+        return self._reliability
+
+
+def _get_success_rate(self: Pattern) -> float:
+    """Get the pattern's historical success rate."""
+    return self._success_rate
+
+
+def _set_success_rate(self: Pattern, value: float) -> None:
+    """Set the success rate and drop the cached reliability score."""
+    self._success_rate = value
+    self._reliability: Optional[float] = None
+
+
+# Installed after the dataclass is built so success_rate stays an __init__,
+# repr and comparison field; __init__ assigns it through the setter, which
+# also initializes the reliability cache
+Pattern.success_rate = property(  # type: ignore[assignment]
+    _get_success_rate, _set_success_rate
+)
+
+
+@lru_cache(maxsize=256)
+def _compile_trigger(trigger: str) -> re.Pattern[str]:
+    """Compile a pattern trigger once and reuse it across patterns.
+    
+    Args:
+        trigger: Regex or keyword trigger
+        
+    Returns:
+        Case-insensitive compiled trigger
+    """
+    return re.compile(trigger, re.IGNORECASE)
\ No newline at end of file
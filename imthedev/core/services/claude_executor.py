@@ -18,6 +18,13 @@ from imthedev.core.orchestration.models import (
     ExecutionResult,
     TestResults,
 )
+from imthedev.core.services.sc_parsing import (
+    command_type,
+    is_valid_flag,
+    parse_progress,
+    parse_test_results,
+    validation_error,
+)
 from imthedev.infrastructure.events import (
     ExecutionComplete,
     ExecutionFailed,
@@ -33,6 +40,61 @@ from imthedev.infrastructure.events import (
 
 logger = logging.getLogger(__name__)
 
+# Bytes requested per read from the subprocess stdout pipe
+_READ_CHUNK_SIZE = 65536
+
+# Patterns are compiled once at import; output parsing runs per line
+_FILE_EVENT_RE = re.compile(r"(Created|Creating|Modified|Updating):\s*(.+)")
+
+# Single-pass scan of command output for SCF metadata
+_META_RE = re.compile(
+    r"SCF Version: (?P<version>[\d.]+)"
+    r"|--(?P<flag>[\w-]+)"
+    r"|(?P<metric>\w+):\s*(?P<value>[\d.]+)(?P<unit>ms|s|%)"
+)
+
+# Metric value directly after a flag ("--timeout: 30s"). The flag alternative
+# of _META_RE consumes the metric's name, so this is checked separately.
+_FLAG_METRIC_RE = re.compile(r":\s*(?P<value>[\d.]+)(?P<unit>ms|s|%)")
+
+# File event emitted for each keyword matched by _FILE_EVENT_RE
+_FILE_EVENT_DISPATCH = {
+    "Created": FileCreated,
+    "Creating": FileCreated,
+    "Modified": FileModified,
+    "Updating": FileModified,
+}
+
+# MCP server reported for each group of enabling flags, in report order
+_MCP_SERVER_FLAGS = (
+    ("Sequential", frozenset({"seq", "sequential"})),
+    ("Context7", frozenset({"c7", "context7"})),
+    ("Magic", frozenset({"magic"})),
+    ("Playwright", frozenset({"play", "playwright"})),
+)
+
+
+def _record_metric(
+    metrics: dict[str, float], name: str, match: re.Match[str]
+) -> None:
+    """Store a matched metric value normalized to ms or a ratio.
+    
+    Args:
+        metrics: Performance metrics to update
+        name: Metric name as it appeared in the output
+        match: Match with "value" and "unit" groups
+    """
+    value = float(match.group("value"))
+    unit = match.group("unit")
+    
+    # Normalize to standard units
+    if unit == "s":
+        value *= 1000  # Convert to ms
+    elif unit == "%":
+        value /= 100  # Convert to ratio
+    
+    metrics[name.lower()] = value
+
 
 class ClaudeCodeExecutor:
     """Manages Claude Code terminal execution with SCF support.
@@ -108,15 +170,13 @@ class ClaudeCodeExecutor:
                 cwd=self.working_directory,
             )
             
-            # Stream output
-            start_time = asyncio.get_event_loop().time()
+            # Stream output against a single deadline for the whole execution
+            loop = asyncio.get_running_loop()
+            start_time = loop.time()
+            deadline = start_time + timeout
             
-            async for line in self._stream_output():
-                # Check timeout
-                elapsed = asyncio.get_event_loop().time() - start_time
-                if elapsed > timeout:
-                    await self._kill_process()
-                    raise asyncio.TimeoutError(f"Command timed out after {timeout}s")
+            async for line in self._stream_output(deadline):
+                elapsed = loop.time() - start_time
                 
                 # Emit streaming event
                 await orchestration_bus.emit(
@@ -135,16 +195,23 @@ class ClaudeCodeExecutor:
                 yield line
             
             # Wait for process to complete
-            return_code = await self.current_process.wait()
+            async with asyncio.timeout_at(deadline):
+                return_code = await self.current_process.wait()
             
             # Create execution result
-            execution_time = asyncio.get_event_loop().time() - start_time
+            execution_time = loop.time() - start_time
             
             logger.info(f"Command completed with code {return_code} in {execution_time:.2f}s")
             
         except asyncio.CancelledError:
             await self._kill_process()
             raise
+        except TimeoutError:
+            await self._kill_process()
+            message = f"Command timed out after {timeout}s"
+            logger.error(f"Execution failed: {message}")
+            await self._emit_failure(command, message)
+            raise TimeoutError(message) from None
         except Exception as e:
             logger.error(f"Execution failed: {e}")
             await self._emit_failure(command, str(e))
@@ -161,34 +228,10 @@ class ClaudeCodeExecutor:
         Returns:
             True if command is valid
         """
-        # Basic SC command pattern validation
-        sc_pattern = r"^/sc:\w+|^sc:\w+"
-        if not re.match(sc_pattern, command.strip()):
-            logger.warning(f"Command doesn't match SC pattern: {command}")
-            return False
-        
-        # Extract command type
-        command_type = self._extract_command_type(command)
-        
-        # Validate known command types
-        valid_commands = [
-            "analyze", "implement", "test", "improve", "build",
-            "document", "git", "workflow", "task", "spawn",
-            "help", "index", "load", "cleanup", "estimate"
-        ]
-        
-        if command_type not in valid_commands:
-            logger.warning(f"Unknown SC command type: {command_type}")
+        error = validation_error(command)
+        if error:
+            logger.warning(error)
             return False
-        
-        # Validate flags (basic check)
-        if "--" in command:
-            flags = re.findall(r"--[\w-]+", command)
-            for flag in flags:
-                if not self._is_valid_flag(flag):
-                    logger.warning(f"Invalid flag: {flag}")
-                    return False
-        
         return True
     
     async def get_execution_result(self) -> ExecutionResult:
@@ -247,54 +290,57 @@ class ClaudeCodeExecutor:
         """
         metadata = ExecutionMetadata()
         
-        # Parse SCF version
-        version_match = re.search(r"SCF Version: ([\d.]+)", output)
-        if version_match:
-            metadata.scf_version = version_match.group(1)
-        
-        # Parse personas used
-        persona_matches = re.findall(r"--persona-(\w+)", output)
-        metadata.personas_used = list(set(persona_matches))
-        
-        # Parse flags
-        flag_matches = re.findall(r"--([\w-]+)", output)
-        metadata.flags_used = list(set(flag_matches))
-        
-        # Parse MCP servers
-        if "--seq" in output or "--sequential" in output:
-            metadata.mcp_servers_used.append("Sequential")
-        if "--c7" in output or "--context7" in output:
-            metadata.mcp_servers_used.append("Context7")
-        if "--magic" in output:
-            metadata.mcp_servers_used.append("Magic")
-        if "--play" in output or "--playwright" in output:
-            metadata.mcp_servers_used.append("Playwright")
-        
-        # Parse thinking depth
-        if "--ultrathink" in output:
+        flags: set[str] = set()
+        personas: set[str] = set()
+        
+        # Every _META_RE alternative needs "--" or ":", so plain output
+        # skips the regex scan entirely
+        matches = (
+            _META_RE.finditer(output) if "--" in output or ":" in output else ()
+        )
+        
+        # Walk the output once, dispatching on whichever alternative matched
+        for match in matches:
+            kind = match.lastgroup
+            if kind == "flag":
+                flag = match.group("flag")
+                flags.add(flag)
+                if flag.startswith("persona-"):
+                    persona = flag[8:].partition("-")[0]
+                    if persona:
+                        personas.add(persona)
+                
+                # The metric name is the last word of the flag, as for "\w+:"
+                name = flag.rpartition("-")[2]
+                metric = _FLAG_METRIC_RE.match(output, match.end())
+                if metric and name:
+                    _record_metric(metadata.performance_metrics, name, metric)
+            elif kind == "version":
+                if not metadata.scf_version:
+                    metadata.scf_version = match.group("version")
+            else:
+                _record_metric(
+                    metadata.performance_metrics, match.group("metric"), match
+                )
+        
+        metadata.personas_used = list(personas)
+        metadata.flags_used = list(flags)
+        
+        # Derive MCP servers and thinking depth from the flags seen
+        metadata.mcp_servers_used = [
+            server for server, server_flags in _MCP_SERVER_FLAGS
+            if not flags.isdisjoint(server_flags)
+        ]
+        
+        if "ultrathink" in flags:
             metadata.thinking_depth = "ultrathink"
-        elif "--think-hard" in output:
+        elif "think-hard" in flags:
             metadata.thinking_depth = "think-hard"
-        elif "--think" in output:
+        elif "think" in flags:
             metadata.thinking_depth = "think"
         else:
             metadata.thinking_depth = "standard"
         
-        # Parse performance metrics if present
-        perf_pattern = r"(\w+):\s*([\d.]+)(ms|s|%)"
-        for match in re.finditer(perf_pattern, output):
-            metric_name = match.group(1).lower()
-            value = float(match.group(2))
-            unit = match.group(3)
-            
-            # Normalize to standard units
-            if unit == "s":
-                value *= 1000  # Convert to ms
-            elif unit == "%":
-                value /= 100  # Convert to ratio
-            
-            metadata.performance_metrics[metric_name] = value
-        
         # Emit metadata event
         await orchestration_bus.emit(
             MetadataExtracted(
@@ -348,10 +394,7 @@ class ClaudeCodeExecutor:
         Returns:
             Command type
         """
-        match = re.match(r"/?sc:(\w+)", command)
-        if match:
-            return match.group(1)
-        return ""
+        return command_type(command)
     
     def _is_valid_flag(self, flag: str) -> bool:
         """Check if a flag is valid for SC commands.
@@ -362,45 +405,51 @@ class ClaudeCodeExecutor:
         Returns:
             True if valid
         """
-        valid_flags = {
-            # Thinking flags
-            "--think", "--think-hard", "--ultrathink",
-            # Persona flags
-            "--persona-architect", "--persona-frontend", "--persona-backend",
-            "--persona-analyzer", "--persona-security", "--persona-mentor",
-            "--persona-refactorer", "--persona-performance", "--persona-qa",
-            "--persona-devops", "--persona-scribe",
-            # MCP flags
-            "--seq", "--sequential", "--c7", "--context7",
-            "--magic", "--play", "--playwright", "--all-mcp", "--no-mcp",
-            # Other flags
-            "--with-tests", "--safe-mode", "--validate", "--uc",
-            "--verbose", "--answer-only", "--introspect",
-            "--delegate", "--parallel", "--loop", "--iterations",
-        }
-        
-        # Check exact match or prefix match for parameterized flags
-        return flag in valid_flags or any(flag.startswith(f) for f in [
-            "--persona-scribe=", "--iterations=", "--concurrency=",
-            "--scope=", "--focus=", "--output=", "--strategy=",
-        ])
+        return is_valid_flag(flag)
     
-    async def _stream_output(self) -> AsyncIterator[str]:
+    async def _stream_output(self, deadline: Optional[float] = None) -> AsyncIterator[str]:
         """Stream output from the subprocess.
         
+        Args:
+            deadline: Event loop time after which reading raises TimeoutError
+        
         Yields:
             Output lines
         """
         if not self.current_process or not self.current_process.stdout:
             return
         
+        # Read in large chunks rather than one await per line. Chunks without
+        # a newline are parked and only joined once their line completes, so
+        # a long line is copied once instead of on every read.
+        stdout = self.current_process.stdout
+        pending: list[bytes] = []
         while True:
-            line = await self.current_process.stdout.readline()
-            if not line:
+            # Only the read itself is bounded; the deadline must not span a
+            # yield, or the consumer would be cancelled instead of the read
+            async with asyncio.timeout_at(deadline):
+                chunk = await stdout.read(_READ_CHUNK_SIZE)
+            if not chunk:
                 break
             
-            decoded_line = line.decode("utf-8", errors="replace").rstrip()
-            yield decoded_line
+            pending.append(chunk)
+            if b"\n" not in chunk:
+                continue
+            
+            data = b"".join(pending)
+            pending.clear()
+            end = data.rfind(b"\n")
+            if end + 1 < len(data):
+                pending.append(data[end + 1:])
+            
+            # Decode every complete line in one call straight from the buffer;
+            # "\n" never occurs inside a multi-byte UTF-8 sequence
+            text = str(memoryview(data)[:end], "utf-8", "replace")
+            for line in text.split("\n"):
+                yield line.rstrip()
+        
+        if pending:
+            yield b"".join(pending).decode("utf-8", errors="replace").rstrip()
     
     async def _parse_output_events(self, line: str) -> None:
         """Parse output line for special events.
@@ -408,34 +457,22 @@ class ClaudeCodeExecutor:
         Args:
             line: Output line to parse
         """
-        # Check for file creation
-        if "Created:" in line or "Creating" in line:
-            match = re.search(r"(?:Created|Creating):\s*(.+)", line)
+        # Check for file creation or modification in a single scan
+        if ":" in line:
+            match = _FILE_EVENT_RE.search(line)
             if match:
-                file_path = Path(match.group(1).strip())
+                event_type = _FILE_EVENT_DISPATCH[match.group(1)]
                 await orchestration_bus.emit(
-                    FileCreated(
+                    event_type(
                         execution_id=self.execution_id,
                         command="",
-                        file_path=file_path,
-                    )
-                )
-        
-        # Check for file modification
-        if "Modified:" in line or "Updating" in line:
-            match = re.search(r"(?:Modified|Updating):\s*(.+)", line)
-            if match:
-                file_path = Path(match.group(1).strip())
-                await orchestration_bus.emit(
-                    FileModified(
-                        execution_id=self.execution_id,
-                        command="",
-                        file_path=file_path,
+                        file_path=Path(match.group(2).strip()),
                     )
                 )
         
         # Check for test results
-        if "tests passed" in line.lower() or "test results" in line.lower():
+        lowered = line.lower()
+        if "tests passed" in lowered or "test results" in lowered:
             test_results = self._parse_test_results(line)
             if test_results:
                 await orchestration_bus.emit(
@@ -473,29 +510,7 @@ class ClaudeCodeExecutor:
         Returns:
             Test results or None
         """
-        # Pattern: "12 passed, 2 failed, 1 skipped"
-        match = re.search(r"(\d+)\s*passed.*?(\d+)\s*failed.*?(\d+)\s*skipped", line)
-        if match:
-            return TestResults(
-                test_suite="",
-                tests_passed=int(match.group(1)),
-                tests_failed=int(match.group(2)),
-                tests_skipped=int(match.group(3)),
-            )
-        
-        # Pattern: "Tests: 12/14 passing (85.7%)"
-        match = re.search(r"Tests?:\s*(\d+)/(\d+)\s*passing\s*\(?([\d.]+)%", line)
-        if match:
-            passed = int(match.group(1))
-            total = int(match.group(2))
-            return TestResults(
-                test_suite="",
-                tests_passed=passed,
-                tests_failed=total - passed,
-                coverage_percentage=float(match.group(3)),
-            )
-        
-        return None
+        return parse_test_results(line)
     
     def _parse_progress(self, line: str) -> Optional[tuple[str, float, str]]:
         """Parse progress information from output line.
@@ -506,25 +521,7 @@ class ClaudeCodeExecutor:
         Returns:
             Tuple of (message, percentage, operation) or None
         """
-        # Pattern: "Progress: 75% - Building components"
-        match = re.search(r"Progress:\s*([\d.]+)%\s*-?\s*(.+)", line)
-        if match:
-            return (
-                line,
-                float(match.group(1)),
-                match.group(2).strip()
-            )
-        
-        # Pattern: "[45%] Analyzing files"
-        match = re.search(r"\[([\d.]+)%\]\s*(.+)", line)
-        if match:
-            return (
-                line,
-                float(match.group(1)),
-                match.group(2).strip()
-            )
-        
-        return None
+        return parse_progress(line)
     
     async def _kill_process(self) -> None:
         """Kill the current subprocess."""
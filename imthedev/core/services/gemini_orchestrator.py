@@ -5,9 +5,12 @@ proposing SuperClaude commands, and interpreting execution results.
 """
 
 import asyncio
+import copy
 import json
 import logging
 import re
+from collections import OrderedDict
+from itertools import islice
 from typing import AsyncIterator, Optional
 
 from imthedev.core.orchestration.models import (
@@ -28,8 +31,17 @@ from imthedev.infrastructure.events import (
     orchestration_bus,
 )
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is optional; its decode errors subclass json's
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+# Number of objective plans kept for reuse by analyze_objective
+_PLAN_CACHE_SIZE = 256
+
+
 
 class GeminiOrchestrator:
     """Manages Gemini's orchestration logic for dual-AI coordination.
@@ -51,6 +63,8 @@ class GeminiOrchestrator:
         self.gemini_adapter = gemini_adapter
         self.context_manager: Optional[OrchestrationContext] = None
         self.patterns: list[Pattern] = []
+        self._inflight: dict[str, asyncio.Future[str]] = {}
+        self._plan_cache: OrderedDict[str, OrchestrationPlan] = OrderedDict()
         self._init_gemini()
     
     def _init_gemini(self) -> None:
@@ -77,9 +91,19 @@ class GeminiOrchestrator:
         
         prompt = self._build_analysis_prompt(objective, matching_pattern)
         
+        # The plan depends only on the prompt, so key on it with whitespace
+        # runs collapsed; case, criteria order and pattern details all count
+        cache_key = " ".join(prompt.split())
+        
         try:
-            response = await self.gemini_adapter.generate_content(prompt)
-            plan = self._parse_plan_response(response, objective)
+            plan = self._get_cached_plan(cache_key, objective)
+            if plan is None:
+                response = await self._generate(prompt)
+                plan = self._parse_plan_response(response, objective)
+                if plan is None:
+                    plan = self._fallback_plan(objective)
+                else:
+                    self._cache_plan(cache_key, plan)
             
             # Emit analysis event
             await orchestration_bus.emit(
@@ -127,7 +151,7 @@ class GeminiOrchestrator:
         prompt = self._build_command_prompt(context, step_description)
         
         try:
-            response = await self.gemini_adapter.generate_content(prompt)
+            response = await self._generate(prompt)
             proposal = self._parse_command_response(response)
             
             # Emit command proposed event
@@ -164,7 +188,7 @@ class GeminiOrchestrator:
         prompt = self._build_analysis_prompt_for_result(result, context)
         
         try:
-            response = await self.gemini_adapter.generate_content(prompt)
+            response = await self._generate(prompt)
             analysis = self._parse_analysis_response(response, result)
             
             # Emit result analyzed event
@@ -213,7 +237,7 @@ class GeminiOrchestrator:
         prompt = self._build_next_step_prompt(analysis, context)
         
         try:
-            response = await self.gemini_adapter.generate_content(prompt)
+            response = await self._generate(prompt)
             proposal = self._parse_command_response(response)
             
             # Emit next step event
@@ -251,7 +275,7 @@ class GeminiOrchestrator:
         prompt = self._build_recovery_prompt(analysis, context)
         
         try:
-            response = await self.gemini_adapter.generate_content(prompt)
+            response = await self._generate(prompt)
             proposal = self._parse_command_response(response)
             
             # Emit recovery event
@@ -271,6 +295,84 @@ class GeminiOrchestrator:
             logger.error(f"Failed to propose recovery: {e}")
             raise
     
+    async def _generate(self, prompt: str) -> str:
+        """Send a prompt to Gemini, coalescing identical in-flight requests.
+        
+        Concurrent callers with the same prompt share one API call instead of
+        each paying for their own. If the caller that sent the request is
+        cancelled, a waiting caller re-issues it rather than being cancelled
+        along with it.
+        
+        Args:
+            prompt: Prompt to send
+            
+        Returns:
+            Gemini's response text
+        """
+        while (pending := self._inflight.get(prompt)) is not None:
+            try:
+                # Shield so a cancelled follower does not cancel the shared result
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                # Only the leading caller was cancelled: send the request again
+                task = asyncio.current_task()
+                assert task is not None
+                if pending.cancelled() and not task.cancelling():
+                    continue
+                raise
+        
+        # First caller sends the request itself and publishes the outcome
+        pending = asyncio.get_running_loop().create_future()
+        self._inflight[prompt] = pending
+        try:
+            response = await self.gemini_adapter.generate_content(prompt)
+        except Exception as e:
+            pending.set_exception(e)
+            pending.exception()  # Raised below, so do not log it as unretrieved
+            raise
+        else:
+            pending.set_result(response)
+            return response
+        finally:
+            # Cancelled or interrupted (KeyboardInterrupt, SystemExit): release
+            # the followers so one of them re-issues the request
+            if not pending.done():
+                pending.cancel()
+            del self._inflight[prompt]
+    
+    def _get_cached_plan(
+        self, key: str, objective: OrchestrationObjective
+    ) -> Optional[OrchestrationPlan]:
+        """Get a copy of a previously generated plan for an equivalent objective.
+        
+        Args:
+            key: Analysis prompt with whitespace collapsed
+            objective: Objective the plan is for
+            
+        Returns:
+            Plan bound to the objective, or None if not cached
+        """
+        cached = self._plan_cache.get(key)
+        if cached is None:
+            return None
+        
+        self._plan_cache.move_to_end(key)
+        logger.info("Reusing cached plan for equivalent objective")
+        plan = copy.deepcopy(cached)
+        plan.objective_id = objective.id
+        return plan
+    
+    def _cache_plan(self, key: str, plan: OrchestrationPlan) -> None:
+        """Store a plan, evicting the least recently used one when full.
+        
+        Args:
+            key: Analysis prompt with whitespace collapsed
+            plan: Plan to store; a copy is kept so callers may mutate theirs
+        """
+        self._plan_cache[key] = copy.deepcopy(plan)
+        if len(self._plan_cache) > _PLAN_CACHE_SIZE:
+            self._plan_cache.popitem(last=False)
+    
     def _find_matching_pattern(self, objective: str) -> Optional[Pattern]:
         """Find a pattern matching the objective.
         
@@ -347,7 +449,9 @@ class GeminiOrchestrator:
             Prompt for Gemini
         """
         history = "\n".join(context.command_history[-5:]) if context.command_history else "None"
-        files = ", ".join(str(p) for p in list(context.file_changes.keys())[-10:])
+        # Walk the newest keys from the end instead of copying every path
+        recent_files = list(islice(reversed(context.file_changes), 10))
+        files = ", ".join(str(p) for p in reversed(recent_files))
         
         return f"""
         Generate the next SuperClaude command for this orchestration step.
@@ -393,6 +497,11 @@ class GeminiOrchestrator:
             Prompt for Gemini
         """
         output_preview = result.stdout[:1000] if result.stdout else result.stderr[:1000]
+        test_summary = (
+            f"{result.tests_run.success_rate:.1%} passing"
+            if result.tests_run
+            else "No tests run"
+        )
         
         return f"""
         Analyze this SuperClaude command execution result.
@@ -406,7 +515,7 @@ class GeminiOrchestrator:
         Output Preview:
         {output_preview}
         
-        Test Results: {result.tests_run.success_rate:.1%} passing if result.tests_run else "No tests run"}
+        Test Results: {test_summary}
         
         Context:
         - Step {context.current_step}/{context.total_steps}
@@ -491,7 +600,7 @@ class GeminiOrchestrator:
     
     def _parse_plan_response(
         self, response: str, objective: OrchestrationObjective
-    ) -> OrchestrationPlan:
+    ) -> Optional[OrchestrationPlan]:
         """Parse Gemini's plan response.
         
         Args:
@@ -499,10 +608,10 @@ class GeminiOrchestrator:
             objective: Related objective
             
         Returns:
-            Orchestration plan
+            Orchestration plan, or None if the response could not be parsed
         """
         try:
-            data = json.loads(response)
+            data = _json_loads(response)
             plan = OrchestrationPlan(objective_id=objective.id)
             
             plan.complexity_score = data.get("complexity", 0.5)
@@ -520,10 +629,20 @@ class GeminiOrchestrator:
             
         except (json.JSONDecodeError, KeyError) as e:
             logger.error(f"Failed to parse plan response: {e}")
-            # Return a basic plan
-            plan = OrchestrationPlan(objective_id=objective.id)
-            plan.add_step("/sc:analyze .", "Initial analysis", 60.0)
-            return plan
+            return None
+    
+    def _fallback_plan(self, objective: OrchestrationObjective) -> OrchestrationPlan:
+        """Build a basic plan for when Gemini's response is unusable.
+        
+        Args:
+            objective: Related objective
+            
+        Returns:
+            Single-step analysis plan
+        """
+        plan = OrchestrationPlan(objective_id=objective.id)
+        plan.add_step("/sc:analyze .", "Initial analysis", 60.0)
+        return plan
     
     def _parse_command_response(self, response: str) -> CommandProposal:
         """Parse Gemini's command response.
@@ -535,7 +654,7 @@ class GeminiOrchestrator:
             Command proposal
         """
         try:
-            data = json.loads(response)
+            data = _json_loads(response)
             return CommandProposal(
                 command=data.get("command", ""),
                 reasoning=data.get("reasoning", ""),
@@ -561,7 +680,7 @@ class GeminiOrchestrator:
             Gemini analysis
         """
         try:
-            data = json.loads(response)
+            data = _json_loads(response)
             analysis = GeminiAnalysis(execution_id=result.execution_id)
             
             analysis.success = data.get("success", False)
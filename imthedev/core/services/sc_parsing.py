@@ -0,0 +1,159 @@
+"""Pure parsing helpers for SuperClaude commands and Claude Code output.
+
+These functions do no I/O and hold no state beyond compiled patterns and
+lookup tables, so they are safe to cache and to compile ahead of time.
+ClaudeCodeExecutor delegates its validation and line parsing here.
+"""
+
+import re
+from functools import lru_cache
+from typing import Optional
+
+from imthedev.core.orchestration.models import TestResults
+
+_SC_CMD_RE = re.compile(r"/?sc:(\w+)")
+_FLAG_RE = re.compile(r"--[\w-]+")
+_TEST_RE_PASSFAIL = re.compile(r"(\d+)\s*passed.*?(\d+)\s*failed.*?(\d+)\s*skipped")
+_TEST_RE_RATIO = re.compile(r"Tests?:\s*(\d+)/(\d+)\s*passing\s*\(?([\d.]+)%")
+_PROGRESS_RE1 = re.compile(r"Progress:\s*([\d.]+)%\s*-?\s*(.+)")
+_PROGRESS_RE2 = re.compile(r"\[([\d.]+)%\]\s*(.+)")
+
+_VALID_COMMANDS = frozenset({
+    "analyze", "implement", "test", "improve", "build",
+    "document", "git", "workflow", "task", "spawn",
+    "help", "index", "load", "cleanup", "estimate",
+})
+
+_VALID_FLAGS = frozenset({
+    # Thinking flags
+    "--think", "--think-hard", "--ultrathink",
+    # Persona flags
+    "--persona-architect", "--persona-frontend", "--persona-backend",
+    "--persona-analyzer", "--persona-security", "--persona-mentor",
+    "--persona-refactorer", "--persona-performance", "--persona-qa",
+    "--persona-devops", "--persona-scribe",
+    # MCP flags
+    "--seq", "--sequential", "--c7", "--context7",
+    "--magic", "--play", "--playwright", "--all-mcp", "--no-mcp",
+    # Other flags
+    "--with-tests", "--safe-mode", "--validate", "--uc",
+    "--verbose", "--answer-only", "--introspect",
+    "--delegate", "--parallel", "--loop", "--iterations",
+})
+
+# Flags that accept a value in --flag=value form
+_PARAM_FLAGS = frozenset({
+    "--persona-scribe", "--iterations", "--concurrency",
+    "--scope", "--focus", "--output", "--strategy",
+})
+
+
+def is_valid_flag(flag: str) -> bool:
+    """Check a flag against the known SC flags.
+    
+    Args:
+        flag: Flag to validate, optionally in --flag=value form
+        
+    Returns:
+        True if valid
+    """
+    # Exact match, or --flag=value for parameterized flags
+    name, sep, _ = flag.partition("=")
+    if sep:
+        return name in _PARAM_FLAGS
+    return flag in _VALID_FLAGS
+
+
+@lru_cache(maxsize=4096)
+def command_type(command: str) -> str:
+    """Extract the command type from an SC command.
+    
+    Args:
+        command: SC command
+        
+    Returns:
+        Command type, or an empty string if the command is not an SC command
+    """
+    match = _SC_CMD_RE.match(command)
+    return match.group(1) if match else ""
+
+
+@lru_cache(maxsize=4096)
+def validation_error(command: str) -> Optional[str]:
+    """Validate an SC command.
+    
+    Results are cached because the AI proposes the same small set of
+    commands over and over.
+    
+    Args:
+        command: Command to validate
+        
+    Returns:
+        Reason the command is invalid, or None if it is valid
+    """
+    # Basic SC command pattern validation
+    if not _SC_CMD_RE.match(command.strip()):
+        return f"Command doesn't match SC pattern: {command}"
+    
+    # Validate known command types
+    sc_type = command_type(command)
+    if sc_type not in _VALID_COMMANDS:
+        return f"Unknown SC command type: {sc_type}"
+    
+    # Validate flags (basic check)
+    if "--" in command:
+        for flag in _FLAG_RE.findall(command):
+            if not is_valid_flag(flag):
+                return f"Invalid flag: {flag}"
+    
+    return None
+
+
+def parse_test_results(line: str) -> Optional[TestResults]:
+    """Parse test results from an output line.
+    
+    Args:
+        line: Output line
+        
+    Returns:
+        Test results or None
+    """
+    # Pattern: "12 passed, 2 failed, 1 skipped"
+    match = _TEST_RE_PASSFAIL.search(line)
+    if match:
+        return TestResults(
+            test_suite="",
+            tests_passed=int(match.group(1)),
+            tests_failed=int(match.group(2)),
+            tests_skipped=int(match.group(3)),
+        )
+    
+    # Pattern: "Tests: 12/14 passing (85.7%)"
+    match = _TEST_RE_RATIO.search(line)
+    if match:
+        passed = int(match.group(1))
+        total = int(match.group(2))
+        return TestResults(
+            test_suite="",
+            tests_passed=passed,
+            tests_failed=total - passed,
+            coverage_percentage=float(match.group(3)),
+        )
+    
+    return None
+
+
+def parse_progress(line: str) -> Optional[tuple[str, float, str]]:
+    """Parse progress information from an output line.
+    
+    Args:
+        line: Output line
+        
+    Returns:
+        Tuple of (message, percentage, operation) or None
+    """
+    # Pattern: "Progress: 75% - Building components", then "[45%] Analyzing files"
+    match = _PROGRESS_RE1.search(line) or _PROGRESS_RE2.search(line)
+    if match:
+        return (line, float(match.group(1)), match.group(2).strip())
+    return None
@@ -11,7 +11,7 @@ from uuid import UUID
 from .orchestration_bus import OrchestrationEvent
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ClaudeEvent(OrchestrationEvent):
     """Base class for Claude Code executor events."""
     
@@ -19,7 +19,7 @@ class ClaudeEvent(OrchestrationEvent):
     command: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExecutionStarted(ClaudeEvent):
     """Event emitted when Claude Code starts executing."""
     
@@ -28,7 +28,7 @@ class ExecutionStarted(ClaudeEvent):
     timeout: float = 300.0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OutputStreaming(ClaudeEvent):
     """Event emitted for real-time output streaming."""
     
@@ -37,7 +37,7 @@ class OutputStreaming(ClaudeEvent):
     timestamp_offset: float = 0.0  # Seconds since execution start
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExecutionProgress(ClaudeEvent):
     """Event emitted for execution progress updates."""
     
@@ -46,7 +46,7 @@ class ExecutionProgress(ClaudeEvent):
     current_operation: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FileCreated(ClaudeEvent):
     """Event emitted when Claude Code creates a file."""
     
@@ -55,7 +55,7 @@ class FileCreated(ClaudeEvent):
     file_type: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FileModified(ClaudeEvent):
     """Event emitted when Claude Code modifies a file."""
     
@@ -65,7 +65,7 @@ class FileModified(ClaudeEvent):
     lines_modified: int = 0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TestExecuted(ClaudeEvent):
     """Event emitted when Claude Code runs tests."""
     
@@ -76,7 +76,7 @@ class TestExecuted(ClaudeEvent):
     coverage_percentage: float = 0.0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExecutionComplete(ClaudeEvent):
     """Event emitted when Claude Code execution completes."""
     
@@ -93,7 +93,7 @@ class ExecutionComplete(ClaudeEvent):
         return self.exit_code == 0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExecutionFailed(ClaudeEvent):
     """Event emitted when Claude Code execution fails."""
     
@@ -103,7 +103,7 @@ class ExecutionFailed(ClaudeEvent):
     recovery_suggestions: list[str] = field(default_factory=list)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MetadataExtracted(ClaudeEvent):
     """Event emitted when SCF metadata is extracted from output."""
     
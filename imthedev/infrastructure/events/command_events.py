@@ -10,7 +10,7 @@ from uuid import UUID
 from .orchestration_bus import OrchestrationEvent
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CommandEvent(OrchestrationEvent):
     """Base class for command-related events."""
     
@@ -18,7 +18,7 @@ class CommandEvent(OrchestrationEvent):
     command_text: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CommandProposed(CommandEvent):
     """Event emitted when Gemini proposes an SC command."""
     
@@ -28,7 +28,7 @@ class CommandProposed(CommandEvent):
     context_used: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CommandApproved(CommandEvent):
     """Event emitted when user approves a command."""
     
@@ -36,7 +36,7 @@ class CommandApproved(CommandEvent):
     modifications: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CommandRejected(CommandEvent):
     """Event emitted when user rejects a command."""
     
@@ -44,7 +44,7 @@ class CommandRejected(CommandEvent):
     reason: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CommandModified(CommandEvent):
     """Event emitted when user modifies a proposed command."""
     
@@ -53,7 +53,7 @@ class CommandModified(CommandEvent):
     modified_by: str = "user"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CommandValidated(CommandEvent):
     """Event emitted after command validation."""
     
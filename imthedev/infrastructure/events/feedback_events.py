@@ -10,14 +10,14 @@ from uuid import UUID
 from .orchestration_bus import OrchestrationEvent
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FeedbackEvent(OrchestrationEvent):
     """Base class for feedback and learning events."""
     
     session_id: UUID = field(default=UUID("00000000-0000-0000-0000-000000000000"))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FeedbackCycleStarted(FeedbackEvent):
     """Event emitted when feedback analysis begins."""
     
@@ -25,7 +25,7 @@ class FeedbackCycleStarted(FeedbackEvent):
     objective_id: UUID = field(default=UUID("00000000-0000-0000-0000-000000000000"))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PatternDetected(FeedbackEvent):
     """Event emitted when a pattern is recognized."""
     
@@ -37,7 +37,7 @@ class PatternDetected(FeedbackEvent):
     occurrences: int = 0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LearningCaptured(FeedbackEvent):
     """Event emitted when learning is extracted."""
     
@@ -48,7 +48,7 @@ class LearningCaptured(FeedbackEvent):
     tags: list[str] = field(default_factory=list)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PatternApplied(FeedbackEvent):
     """Event emitted when a learned pattern is applied."""
     
@@ -58,7 +58,7 @@ class PatternApplied(FeedbackEvent):
     adjustments_made: list[str] = field(default_factory=list)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ContextUpdated(FeedbackEvent):
     """Event emitted when orchestration context is updated."""
     
@@ -68,7 +68,7 @@ class ContextUpdated(FeedbackEvent):
     total_context_size: int = 0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MetricsCalculated(FeedbackEvent):
     """Event emitted when performance metrics are calculated."""
     
@@ -80,7 +80,7 @@ class MetricsCalculated(FeedbackEvent):
     custom_metrics: dict[str, float] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FeedbackCycleComplete(FeedbackEvent):
     """Event emitted when feedback cycle completes."""
     
@@ -10,7 +10,7 @@ from uuid import UUID
 from .orchestration_bus import OrchestrationEvent
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GeminiEvent(OrchestrationEvent):
     """Base class for Gemini orchestrator events."""
     
@@ -18,7 +18,7 @@ class GeminiEvent(OrchestrationEvent):
     step_number: int = 0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ObjectiveSubmitted(GeminiEvent):
     """Event emitted when user submits an objective."""
     
@@ -27,7 +27,7 @@ class ObjectiveSubmitted(GeminiEvent):
     context: dict[str, str] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ObjectiveAnalyzed(GeminiEvent):
     """Event emitted after Gemini analyzes an objective."""
     
@@ -38,7 +38,7 @@ class ObjectiveAnalyzed(GeminiEvent):
     required_capabilities: list[str] = field(default_factory=list)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PlanGenerated(GeminiEvent):
     """Event emitted when Gemini generates execution plan."""
     
@@ -48,7 +48,7 @@ class PlanGenerated(GeminiEvent):
     risk_assessment: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ResultAnalyzed(GeminiEvent):
     """Event emitted after Gemini analyzes execution results."""
     
@@ -60,7 +60,7 @@ class ResultAnalyzed(GeminiEvent):
     confidence: float = 0.0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NextStepProposed(GeminiEvent):
     """Event emitted when Gemini proposes next orchestration step."""
     
@@ -70,7 +70,7 @@ class NextStepProposed(GeminiEvent):
     expected_outcome: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ObjectiveCompleted(GeminiEvent):
     """Event emitted when objective is successfully completed."""
     
@@ -80,7 +80,7 @@ class ObjectiveCompleted(GeminiEvent):
     learned_patterns: list[str] = field(default_factory=list)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RecoveryProposed(GeminiEvent):
     """Event emitted when Gemini proposes error recovery."""
     
@@ -5,7 +5,7 @@ Gemini orchestrator and Claude Code executor components.
 """
 
 import asyncio
-from collections import defaultdict
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Callable, Coroutine, Optional
@@ -15,7 +15,7 @@ import logging
 logger = logging.getLogger(__name__)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OrchestrationEvent:
     """Base class for all orchestration events."""
     
@@ -35,10 +35,15 @@ class OrchestrationEventBus:
     def __init__(self) -> None:
         """Initialize the event bus."""
         self._handlers: dict[type[OrchestrationEvent], list[Callable]] = defaultdict(list)
-        self._event_history: list[OrchestrationEvent] = []
+        self._dispatch_cache: dict[type[OrchestrationEvent], tuple[Callable, ...]] = {}
+        self._history_limit = 10_000
+        self._event_history: deque[OrchestrationEvent] = deque(
+            maxlen=self._history_limit
+        )
         self._replay_mode: bool = False
         self._event_queue: asyncio.Queue[OrchestrationEvent] = asyncio.Queue()
         self._processing: bool = False
+        self._inflight: set[asyncio.Task[None]] = set()
         self._metrics = {
             "events_processed": 0,
             "events_failed": 0,
@@ -57,6 +62,7 @@ class OrchestrationEventBus:
             handler: Async function to handle the event
         """
         self._handlers[event_type].append(handler)
+        self._dispatch_cache.clear()
         logger.debug(f"Subscribed {handler.__name__} to {event_type.__name__}")
     
     def unsubscribe(
@@ -72,8 +78,19 @@ class OrchestrationEventBus:
         """
         if handler in self._handlers[event_type]:
             self._handlers[event_type].remove(handler)
+            self._dispatch_cache.clear()
             logger.debug(f"Unsubscribed {handler.__name__} from {event_type.__name__}")
     
+    def unsubscribe_all(self) -> None:
+        """Remove every subscribed handler.
+        
+        Events already being processed still finish, so drain() keeps
+        waiting for them.
+        """
+        self._handlers.clear()
+        self._dispatch_cache.clear()
+        logger.debug("Unsubscribed all handlers")
+    
     async def emit(self, event: OrchestrationEvent) -> None:
         """Emit an event to all subscribed handlers.
         
@@ -84,7 +101,18 @@ class OrchestrationEventBus:
         
         # Start processing if not already running
         if not self._processing:
-            asyncio.create_task(self._process_events())
+            task = asyncio.create_task(self._process_events())
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+    
+    async def drain(self) -> None:
+        """Wait until all emitted events have been handled.
+        
+        Handlers may emit further events while the bus drains, so this keeps
+        waiting until no processing task is left in flight.
+        """
+        while self._inflight:
+            await asyncio.gather(*self._inflight)
     
     async def _process_events(self) -> None:
         """Process events from the queue."""
@@ -128,21 +156,28 @@ class OrchestrationEventBus:
     
     def _get_handlers_for_event(
         self, event: OrchestrationEvent
-    ) -> list[Callable]:
+    ) -> tuple[Callable, ...]:
         """Get all handlers that should process this event.
         
+        The handlers for each event class are resolved once by walking its
+        MRO and cached until the subscriptions change.
+        
         Args:
             event: Event to find handlers for
             
         Returns:
-            List of handler functions
+            Tuple of handler functions
         """
-        handlers = []
-        
-        # Check event type and all parent classes
-        for event_class in event.__class__.__mro__:
-            if event_class in self._handlers:
-                handlers.extend(self._handlers[event_class])
+        event_type = type(event)
+        handlers = self._dispatch_cache.get(event_type)
+        if handlers is None:
+            # Check event type and all parent classes
+            handlers = tuple(
+                handler
+                for event_class in event_type.__mro__
+                for handler in self._handlers.get(event_class, ())
+            )
+            self._dispatch_cache[event_type] = handlers
         
         return handlers
     
@@ -157,9 +192,11 @@ class OrchestrationEventBus:
         """
         self._replay_mode = True
         
-        events_to_replay = self._event_history
+        # Snapshot first: replayed events are appended to the history again
         if filter_fn:
-            events_to_replay = [e for e in events_to_replay if filter_fn(e)]
+            events_to_replay = list(filter(filter_fn, self._event_history))
+        else:
+            events_to_replay = list(self._event_history)
         
         logger.info(f"Replaying {len(events_to_replay)} events")
         
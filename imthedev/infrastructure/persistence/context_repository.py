@@ -141,7 +141,7 @@ class ContextRepository(ContextService):
         # Keep only the last 100 commands to prevent unbounded growth
         MAX_HISTORY_SIZE = 100
         if len(context.history) > MAX_HISTORY_SIZE:
-            context.history = context.history[-MAX_HISTORY_SIZE:]
+            del context.history[:-MAX_HISTORY_SIZE]
 
         # Save updated context
         await self.save_context(project_id, context)
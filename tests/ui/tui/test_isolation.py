@@ -6,6 +6,7 @@ to prevent test pollution and ensure tests work both individually and together.
 
 import sys
 from contextlib import contextmanager
+from dataclasses import field, make_dataclass
 from typing import Any, Dict, Generator, Optional
 from unittest.mock import MagicMock
 
@@ -14,12 +15,30 @@ import pytest
 
 class MockMessage:
     """Base mock message class for component communication."""
-    pass
+
+    __slots__ = ()
+
+
+def _make_message(name: str, *fields: str) -> type[MockMessage]:
+    """Create a slotted message class whose fields all default to None."""
+    return make_dataclass(
+        name,
+        [(f, Any, field(default=None)) for f in fields],
+        bases=(MockMessage,),
+        slots=True,
+    )
 
 
 class ComponentMocker:
     """Centralized component mocking utility to ensure test isolation."""
     
+    _MODULE_NAMES = (
+        "imthedev.ui.tui.components.project_selector",
+        "imthedev.ui.tui.components.command_dashboard",
+        "imthedev.ui.tui.components.approval_controls",
+        "imthedev.ui.tui.components.status_bar",
+    )
+    
     def __init__(self):
         """Initialize the component mocker with mock definitions."""
         self._original_modules: Dict[str, Any] = {}
@@ -34,17 +53,8 @@ class ComponentMocker:
         project_selector.__name__ = "ProjectSelector"
         
         # Create ProjectSelected message class
-        def project_selected_init(self, project=None, project_id=None, 
-                                   project_name=None, project_path=None):
-            setattr(self, "project", project)
-            setattr(self, "project_id", project_id)
-            setattr(self, "project_name", project_name)
-            setattr(self, "project_path", project_path)
-        
-        project_selected = type(
-            "ProjectSelected",
-            (MockMessage,),
-            {"__init__": project_selected_init},
+        project_selected = _make_message(
+            "ProjectSelected", "project", "project_id", "project_name", "project_path"
         )
         project_selector.ProjectSelected = project_selected
         mocks["project_selector"] = project_selector
@@ -54,18 +64,10 @@ class ComponentMocker:
         command_dashboard.__name__ = "CommandDashboard"
         
         # Create CommandDashboard message classes
-        def command_submitted_init(self, command=None, command_id=None):
-            setattr(self, "command", command)
-            setattr(self, "command_id", command_id)
-        
-        command_submitted = type(
-            "CommandSubmitted",
-            (MockMessage,),
-            {"__init__": command_submitted_init},
-        )
-        command_cleared = type("CommandCleared", (MockMessage,), {})
-        command_changed = type("CommandChanged", (MockMessage,), {})
-        navigation_requested = type("NavigationRequested", (MockMessage,), {})
+        command_submitted = _make_message("CommandSubmitted", "command", "command_id")
+        command_cleared = _make_message("CommandCleared")
+        command_changed = _make_message("CommandChanged")
+        navigation_requested = _make_message("NavigationRequested")
         
         command_dashboard.CommandSubmitted = command_submitted
         command_dashboard.CommandCleared = command_cleared
@@ -78,30 +80,9 @@ class ComponentMocker:
         approval_controls.__name__ = "ApprovalControls"
         
         # Create ApprovalControls message classes
-        def command_approved_init(self, command_id=None):
-            setattr(self, "command_id", command_id)
-        
-        command_approved = type(
-            "CommandApproved",
-            (MockMessage,),
-            {"__init__": command_approved_init},
-        )
-        def command_denied_init(self, command_id=None):
-            setattr(self, "command_id", command_id)
-        
-        command_denied = type(
-            "CommandDenied",
-            (MockMessage,),
-            {"__init__": command_denied_init},
-        )
-        def autopilot_toggled_init(self, enabled=None):
-            setattr(self, "enabled", enabled)
-        
-        autopilot_toggled = type(
-            "AutopilotToggled",
-            (MockMessage,),
-            {"__init__": autopilot_toggled_init},
-        )
+        command_approved = _make_message("CommandApproved", "command_id")
+        command_denied = _make_message("CommandDenied", "command_id")
+        autopilot_toggled = _make_message("AutopilotToggled", "enabled")
         
         approval_controls.CommandApproved = command_approved
         approval_controls.CommandDenied = command_denied
@@ -113,9 +94,9 @@ class ComponentMocker:
         status_bar.__name__ = "StatusBar"
         
         # Create StatusBar message classes
-        autopilot_toggled_sb = type("AutopilotToggled", (MockMessage,), {})
-        model_changed = type("ModelChanged", (MockMessage,), {})
-        status_message_changed = type("StatusMessageChanged", (MockMessage,), {})
+        autopilot_toggled_sb = _make_message("AutopilotToggled")
+        model_changed = _make_message("ModelChanged")
+        status_message_changed = _make_message("StatusMessageChanged")
         
         status_bar.AutopilotToggled = autopilot_toggled_sb
         status_bar.ModelChanged = model_changed
@@ -127,42 +108,32 @@ class ComponentMocker:
     def setup_mocks(self) -> None:
         """Install mocked component modules in sys.modules."""
         # Save original modules if they exist
-        module_names = [
-            "imthedev.ui.tui.components.project_selector",
-            "imthedev.ui.tui.components.command_dashboard",
-            "imthedev.ui.tui.components.approval_controls",
-            "imthedev.ui.tui.components.status_bar",
-        ]
-        
-        for module_name in module_names:
+        for module_name in self._MODULE_NAMES:
             if module_name in sys.modules:
                 self._original_modules[module_name] = sys.modules[module_name]
         
-        # Install mocks
+        # Install mocks; spec limits each module to the component it exports
         sys.modules["imthedev.ui.tui.components.project_selector"] = MagicMock(
-            ProjectSelector=self._mock_components["project_selector"]
+            spec=["ProjectSelector"],
+            ProjectSelector=self._mock_components["project_selector"],
         )
         sys.modules["imthedev.ui.tui.components.command_dashboard"] = MagicMock(
-            CommandDashboard=self._mock_components["command_dashboard"]
+            spec=["CommandDashboard"],
+            CommandDashboard=self._mock_components["command_dashboard"],
         )
         sys.modules["imthedev.ui.tui.components.approval_controls"] = MagicMock(
-            ApprovalControls=self._mock_components["approval_controls"]
+            spec=["ApprovalControls"],
+            ApprovalControls=self._mock_components["approval_controls"],
         )
         sys.modules["imthedev.ui.tui.components.status_bar"] = MagicMock(
-            StatusBar=self._mock_components["status_bar"]
+            spec=["StatusBar"],
+            StatusBar=self._mock_components["status_bar"],
         )
     
     def cleanup_mocks(self) -> None:
         """Remove mocked component modules and restore originals."""
-        module_names = [
-            "imthedev.ui.tui.components.project_selector",
-            "imthedev.ui.tui.components.command_dashboard",
-            "imthedev.ui.tui.components.approval_controls",
-            "imthedev.ui.tui.components.status_bar",
-        ]
-        
         # Remove mocked modules
-        for module_name in module_names:
+        for module_name in self._MODULE_NAMES:
             if module_name in sys.modules:
                 del sys.modules[module_name]
         
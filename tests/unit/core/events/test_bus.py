@@ -1,6 +1,7 @@
 """Unit tests for the event bus implementation."""
 
 import asyncio
+import logging
 from datetime import datetime
 from uuid import uuid4
 
@@ -8,6 +9,14 @@ import pytest
 
 from imthedev.core.events import Event, EventBus, EventTypes, ScopedEventBus
 
+pytestmark = [
+    pytest.mark.asyncio(loop_scope="module"),
+    # The module-wide mark also reaches the synchronous tests here
+    pytest.mark.filterwarnings(
+        "ignore:The test <Function .*> is marked with '@pytest.mark.asyncio'"
+    ),
+]
+
 
 class TestEvent:
     """Test the Event dataclass."""
@@ -64,7 +73,6 @@ class TestEventBus:
         assert event_bus.get_handler_count() == 0
         assert len(event_bus.get_history()) == 0
 
-    @pytest.mark.asyncio
     async def test_subscribe_and_publish(self, event_bus) -> None:
         """Test basic subscribe and publish functionality."""
         received_events = []
@@ -82,13 +90,12 @@ class TestEventBus:
         assert len(received_events) == 1
         assert received_events[0] == event
 
-    @pytest.mark.asyncio
     async def test_async_handler(self, event_bus) -> None:
         """Test async event handlers."""
         received_events = []
 
         async def async_handler(event: Event):
-            await asyncio.sleep(0.01)  # Simulate async work
+            await asyncio.sleep(0)  # Yield to the event loop once
             received_events.append(event)
 
         event_bus.subscribe_async(EventTypes.COMMAND_EXECUTING, async_handler)
@@ -99,7 +106,6 @@ class TestEventBus:
         assert len(received_events) == 1
         assert received_events[0] == event
 
-    @pytest.mark.asyncio
     async def test_multiple_handlers(self, event_bus) -> None:
         """Test multiple handlers for same event type."""
         handler1_events = []
@@ -121,7 +127,6 @@ class TestEventBus:
         assert len(handler2_events) == 1
         assert handler1_events[0] == handler2_events[0] == event
 
-    @pytest.mark.asyncio
     async def test_global_handler(self, event_bus) -> None:
         """Test global handler receives all events."""
         all_events = []
@@ -136,14 +141,15 @@ class TestEventBus:
         event2 = Event(type=EventTypes.COMMAND_APPROVED, payload={})
         event3 = Event(type=EventTypes.STATE_UPDATED, payload={})
 
-        await event_bus.publish(event1)
-        await event_bus.publish(event2)
-        await event_bus.publish(event3)
+        await asyncio.gather(
+            event_bus.publish(event1),
+            event_bus.publish(event2),
+            event_bus.publish(event3),
+        )
 
         assert len(all_events) == 3
         assert all_events == [event1, event2, event3]
 
-    @pytest.mark.asyncio
     async def test_unsubscribe(self, event_bus) -> None:
         """Test unsubscribing handlers."""
         received_events = []
@@ -165,8 +171,7 @@ class TestEventBus:
 
         assert len(received_events) == 1  # No new event received
 
-    @pytest.mark.asyncio
-    async def test_error_handling(self, event_bus) -> None:
+    async def test_error_handling(self, event_bus, caplog) -> None:
         """Test that errors in handlers don't break event bus."""
         successful_events = []
 
@@ -180,23 +185,24 @@ class TestEventBus:
         event_bus.subscribe(EventTypes.SYSTEM_ERROR, failing_handler)
         event_bus.subscribe(EventTypes.SYSTEM_ERROR, working_handler)
 
-        # Publish event - should not raise
+        # Publish event - should not raise. The bus logs the handler error with
+        # a traceback; silence it so the test doesn't pay for formatting it.
         event = Event(type=EventTypes.SYSTEM_ERROR, payload={"error": "test"})
-        await event_bus.publish(event)
+        with caplog.at_level(logging.CRITICAL, logger="imthedev.core.events"):
+            await event_bus.publish(event)
 
         # Working handler should still receive event
         assert len(successful_events) == 1
         assert successful_events[0] == event
 
-    @pytest.mark.asyncio
     async def test_event_history(self, event_bus) -> None:
         """Test event history functionality."""
         # Publish some events
-        events = []
-        for i in range(5):
-            event = Event(type=EventTypes.STATE_UPDATED, payload={"index": i})
-            events.append(event)
-            await event_bus.publish(event)
+        events = [
+            Event(type=EventTypes.STATE_UPDATED, payload={"index": i})
+            for i in range(5)
+        ]
+        await asyncio.gather(*(event_bus.publish(event) for event in events))
 
         # Check full history
         history = event_bus.get_history()
@@ -217,7 +223,6 @@ class TestEventBus:
         assert len(filtered) == 5
         assert all(e.type == EventTypes.STATE_UPDATED for e in filtered)
 
-    @pytest.mark.asyncio
     async def test_pause_and_resume(self, event_bus) -> None:
         """Test pausing and resuming event processing."""
         received_events = []
@@ -272,14 +277,31 @@ class TestEventBus:
         assert event_bus.get_handler_count() == 4  # Total including global
 
 
+@pytest.fixture(scope="module")
+def shared_buses() -> tuple[EventBus, ScopedEventBus]:
+    """Create one parent/scoped bus pair shared by the scoped bus tests."""
+    parent_bus = EventBus("parent")
+    return parent_bus, ScopedEventBus("ui", parent_bus)
+
+
 class TestScopedEventBus:
     """Test the ScopedEventBus implementation."""
 
-    @pytest.mark.asyncio
-    async def test_scoped_bus_namespace(self) -> None:
+    @pytest.fixture
+    def buses(
+        self, shared_buses: tuple[EventBus, ScopedEventBus]
+    ) -> tuple[EventBus, ScopedEventBus]:
+        """Hand out the shared bus pair with handlers and history reset."""
+        for bus in shared_buses:
+            bus._handlers.clear()
+            bus._async_handlers.clear()
+            bus._global_handlers.clear()
+            bus.clear_history()
+        return shared_buses
+
+    async def test_scoped_bus_namespace(self, buses) -> None:
         """Test that scoped bus adds namespace to events."""
-        parent_bus = EventBus("parent")
-        scoped_bus = ScopedEventBus("ui", parent_bus)
+        parent_bus, scoped_bus = buses
 
         parent_events = []
 
@@ -296,11 +318,9 @@ class TestScopedEventBus:
         assert len(parent_events) == 1
         assert parent_events[0].source == "ui"
 
-    @pytest.mark.asyncio
-    async def test_scoped_bus_local_events(self) -> None:
+    async def test_scoped_bus_local_events(self, buses) -> None:
         """Test that local events don't propagate to parent."""
-        parent_bus = EventBus("parent")
-        scoped_bus = ScopedEventBus("worker", parent_bus)
+        parent_bus, scoped_bus = buses
 
         parent_events = []
         scoped_events = []
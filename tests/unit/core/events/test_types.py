@@ -1,32 +1,54 @@
 """Unit tests for event type definitions."""
 
 
+import pytest
+
 from imthedev.core.events import EventPriority, EventTypes
 
+# One representative event per priority level, highest priority first
+_EVENTS_BY_PRIORITY = (
+    EventTypes.SYSTEM_ERROR,
+    EventTypes.UI_COMMAND_APPROVE_REQUESTED,
+    EventTypes.PROJECT_CREATED,
+    EventTypes.STORAGE_SAVE_STARTED,
+)
+_UNORDERED_EVENTS = (
+    EventTypes.PROJECT_CREATED,
+    EventTypes.SYSTEM_ERROR,
+    EventTypes.STORAGE_SAVE_STARTED,
+    EventTypes.UI_COMMAND_APPROVE_REQUESTED,
+)
+
+
+@pytest.fixture(scope="module")
+def valid_events() -> frozenset[str]:
+    """All defined event types as a set for O(1) membership checks."""
+    return frozenset(EventTypes.all_events())
+
 
 class TestEventTypes:
     """Test the EventTypes class."""
 
-    def test_event_type_values(self) -> None:
+    @pytest.mark.parametrize(
+        ("event_type", "expected"),
+        [
+            (EventTypes.PROJECT_CREATED, "project.created"),
+            (EventTypes.COMMAND_APPROVED, "command.approved"),
+            (EventTypes.STATE_AUTOPILOT_ENABLED, "state.autopilot.enabled"),
+            (EventTypes.SYSTEM_STARTUP, "system.startup"),
+        ],
+    )
+    def test_event_type_values(self, event_type: str, expected: str) -> None:
         """Test that event types have correct string values."""
-        assert EventTypes.PROJECT_CREATED == "project.created"
-        assert EventTypes.COMMAND_APPROVED == "command.approved"
-        assert EventTypes.STATE_AUTOPILOT_ENABLED == "state.autopilot.enabled"
-        assert EventTypes.SYSTEM_STARTUP == "system.startup"
+        assert event_type == expected
 
     def test_event_naming_convention(self) -> None:
         """Test that all events follow the naming convention."""
         all_events = EventTypes.all_events()
 
-        for event in all_events:
-            # Should contain at least one dot
-            assert "." in event, f"Event {event} doesn't follow naming convention"
-
-            # Should be lowercase
-            assert event.islower(), f"Event {event} should be lowercase"
-
-            # Should not have spaces
-            assert " " not in event, f"Event {event} contains spaces"
+        # Every event needs at least one dot, must be lowercase and has no spaces
+        bad = {e for e in all_events if "." not in e or not e.islower() or " " in e}
+        assert not bad, f"Events not following naming convention: {sorted(bad)}"
 
     def test_all_events(self) -> None:
         """Test getting all event types."""
@@ -44,16 +66,17 @@ class TestEventTypes:
         assert "all_events" not in all_events
         assert "__dict__" not in all_events
 
-    def test_is_valid_event(self) -> None:
+    def test_is_valid_event(self, valid_events: frozenset[str]) -> None:
         """Test event validation."""
         # Valid events
-        assert EventTypes.is_valid_event(EventTypes.PROJECT_CREATED)
-        assert EventTypes.is_valid_event(EventTypes.COMMAND_FAILED)
+        for event in (EventTypes.PROJECT_CREATED, EventTypes.COMMAND_FAILED):
+            assert event in valid_events
+            assert EventTypes.is_valid_event(event)
 
         # Invalid events
-        assert not EventTypes.is_valid_event("invalid.event")
-        assert not EventTypes.is_valid_event("")
-        assert not EventTypes.is_valid_event("PROJECT_CREATED")  # Wrong case
+        for event in ("invalid.event", "", "PROJECT_CREATED"):  # Last: wrong case
+            assert event not in valid_events
+            assert not EventTypes.is_valid_event(event)
 
     def test_get_domain(self) -> None:
         """Test extracting domain from event type."""
@@ -166,29 +189,14 @@ class TestEventPriority:
     def test_priority_ordering(self) -> None:
         """Test that priorities can be used for sorting."""
         events = [
-            (
-                EventTypes.PROJECT_CREATED,
-                EventPriority.get_priority(EventTypes.PROJECT_CREATED),
-            ),
-            (
-                EventTypes.SYSTEM_ERROR,
-                EventPriority.get_priority(EventTypes.SYSTEM_ERROR),
-            ),
-            (
-                EventTypes.STORAGE_SAVE_STARTED,
-                EventPriority.get_priority(EventTypes.STORAGE_SAVE_STARTED),
-            ),
-            (
-                EventTypes.UI_COMMAND_APPROVE_REQUESTED,
-                EventPriority.get_priority(EventTypes.UI_COMMAND_APPROVE_REQUESTED),
-            ),
+            (event_type, EventPriority.get_priority(event_type))
+            for event_type in _UNORDERED_EVENTS
         ]
 
         # Sort by priority (lower number = higher priority)
         sorted_events = sorted(events, key=lambda x: x[1])
 
-        # Check order
-        assert sorted_events[0][0] == EventTypes.SYSTEM_ERROR  # Critical
-        assert sorted_events[1][0] == EventTypes.UI_COMMAND_APPROVE_REQUESTED  # High
-        assert sorted_events[2][0] == EventTypes.PROJECT_CREATED  # Normal
-        assert sorted_events[3][0] == EventTypes.STORAGE_SAVE_STARTED  # Low
+        # Critical, high, normal, low
+        assert [event_type for event_type, _ in sorted_events] == list(
+            _EVENTS_BY_PRIORITY
+        )
@@ -1,5 +1,12 @@
 """Unit tests for service interface contracts and mock implementations."""
 
+import heapq
+import os
+import re
+from collections import deque
+from collections.abc import Iterable
+from datetime import datetime
+from operator import methodcaller
 from pathlib import Path
 from typing import Callable
 from uuid import UUID, uuid4
@@ -20,10 +27,41 @@ from imthedev.core.interfaces import (
     CommandAnalysis,
 )
 
+_UUID_BATCH = 256
+_uuid_pool: list[UUID] = []
+
+
+def _fast_uuid4() -> UUID:
+    """Return a random UUID4, drawing entropy in batches of _UUID_BATCH."""
+    if not _uuid_pool:
+        raw = os.urandom(16 * _UUID_BATCH)
+        # version=4 also sets the RFC 4122 variant bits
+        _uuid_pool.extend(
+            UUID(bytes=raw[i : i + 16], version=4) for i in range(0, len(raw), 16)
+        )
+    return _uuid_pool.pop()
+
+
+# Keyword dispatch for MockAIOrchestrator.generate_command. Alternatives are
+# tried in order from the start of the objective, so "git" wins over
+# "create ... file" just like the if/elif chain it replaces.
+_OBJECTIVE_DISPATCH = re.compile(
+    r"(?=.*git)(?P<git>)|(?=.*create)(?=.*file)(?P<create_file>)",
+    re.IGNORECASE | re.DOTALL,
+)
+# Case-insensitive search avoids lowercasing a copy of the whole output
+_ERROR_RE = re.compile("error", re.IGNORECASE)
+
+_VALID_MODELS: frozenset[str] = frozenset(
+    {AIModel.GEMINI_FLASH, AIModel.GEMINI_PRO, AIModel.GEMINI_FLASH_8B}
+)
+
 
 class MockProjectService:
     """Mock implementation of ProjectService for testing."""
 
+    __slots__ = ("projects", "current_project_id")
+
     def __init__(self):
         self.projects: dict[UUID, Project] = {}
         self.current_project_id: UUID | None = None
@@ -39,7 +77,8 @@ class MockProjectService:
         return self.projects.get(project_id)
 
     async def list_projects(self) -> list[Project]:
-        return sorted(self.projects.values(), key=lambda p: p.created_at)
+        # Projects are inserted as they are created, so dict order is created_at order
+        return list(self.projects.values())
 
     async def update_project(self, project: Project) -> None:
         if project.id not in self.projects:
@@ -47,9 +86,8 @@ class MockProjectService:
         self.projects[project.id] = project
 
     async def delete_project(self, project_id: UUID) -> None:
-        if project_id not in self.projects:
+        if self.projects.pop(project_id, None) is None:
             raise ValueError(f"Project {project_id} not found")
-        del self.projects[project_id]
         if self.current_project_id == project_id:
             self.current_project_id = None
 
@@ -67,21 +105,28 @@ class MockProjectService:
 class MockContextService:
     """Mock implementation of ContextService for testing."""
 
+    __slots__ = ("contexts", "_by_id")
+
     def __init__(self):
         self.contexts: dict[UUID, ProjectContext] = {}
+        # Per-project command index for O(1) status updates
+        self._by_id: dict[UUID, dict[UUID, Command]] = {}
 
     async def save_context(self, project_id: UUID, context: ProjectContext) -> None:
         self.contexts[project_id] = context
+        self._by_id[project_id] = {cmd.id: cmd for cmd in context.history}
 
     async def load_context(self, project_id: UUID) -> ProjectContext:
-        if project_id not in self.contexts:
+        context = self.contexts.get(project_id)
+        if context is None:
             raise ValueError(f"Context for project {project_id} not found")
-        return self.contexts[project_id]
+        return context
 
     async def append_command(self, project_id: UUID, command: Command) -> None:
         if project_id not in self.contexts:
             self.contexts[project_id] = ProjectContext()
         self.contexts[project_id].history.append(command)
+        self._by_id.setdefault(project_id, {})[command.id] = command
 
     async def get_command_history(
         self,
@@ -92,11 +137,12 @@ class MockContextService:
         if project_id not in self.contexts:
             return []
 
-        history = self.contexts[project_id].history
+        history: Iterable[Command] = self.contexts[project_id].history
         if status_filter:
-            history = [cmd for cmd in history if cmd.status == status_filter]
+            history = (cmd for cmd in history if cmd.status == status_filter)
 
-        return sorted(history, key=lambda c: c.timestamp, reverse=True)[:limit]
+        # Only the newest `limit` commands are needed, not a full sort
+        return heapq.nlargest(limit, history, key=lambda c: c.timestamp)
 
     async def update_command_status(
         self, project_id: UUID, command_id: UUID, status: CommandStatus
@@ -104,31 +150,37 @@ class MockContextService:
         if project_id not in self.contexts:
             raise ValueError(f"Project {project_id} not found")
 
-        for cmd in self.contexts[project_id].history:
-            if cmd.id == command_id:
-                cmd.status = status
-                return
-
-        raise ValueError(f"Command {command_id} not found")
+        index = self._by_id.setdefault(project_id, {})
+        cmd = index.get(command_id)
+        if cmd is None:
+            # Commands appended to a loaded context's history bypass the index
+            history = self.contexts[project_id].history
+            cmd = next((c for c in history if c.id == command_id), None)
+            if cmd is None:
+                raise ValueError(f"Command {command_id} not found")
+            index[command_id] = cmd
+        cmd.status = status
 
 
 class MockAIOrchestrator:
     """Mock implementation of AIOrchestrator for testing."""
 
-    def __init__(self):
-        self.available_models = [
-            AIModel.GEMINI_FLASH,
-            AIModel.GEMINI_PRO,
-            AIModel.GEMINI_FLASH_8B,
-        ]
+    __slots__ = ()
+
+    AVAILABLE_MODELS: tuple[str, ...] = (
+        AIModel.GEMINI_FLASH,
+        AIModel.GEMINI_PRO,
+        AIModel.GEMINI_FLASH_8B,
+    )
 
     async def generate_command(
         self, context: ProjectContext, objective: str, model: str = AIModel.GEMINI_FLASH
     ) -> tuple[str, str]:
-        # Simple mock logic for testing
-        if "git" in objective.lower():
+        # Simple mock logic for testing; nothing shorter than "git" can match
+        match = _OBJECTIVE_DISPATCH.match(objective) if len(objective) >= 3 else None
+        if match and match.lastgroup == "git":
             return "git init", "Initialize a new git repository"
-        elif "create" in objective.lower() and "file" in objective.lower():
+        elif match and match.lastgroup == "create_file":
             return "touch README.md", "Create a new README file"
         else:
             return "echo 'Task completed'", "Execute the requested task"
@@ -136,7 +188,7 @@ class MockAIOrchestrator:
     async def analyze_result(
         self, command: Command, output: str, context: ProjectContext
     ) -> CommandAnalysis:
-        success = "error" not in output.lower()
+        success = _ERROR_RE.search(output) is None
         return CommandAnalysis(
             success=success,
             next_action="Continue with next task" if success else None,
@@ -144,7 +196,7 @@ class MockAIOrchestrator:
         )
 
     def get_available_models(self) -> list[str]:
-        return self.available_models
+        return list(self.AVAILABLE_MODELS)
 
     async def estimate_tokens(self, context: ProjectContext, objective: str) -> int:
         # Simple estimation based on context size
@@ -157,56 +209,78 @@ class MockAIOrchestrator:
 class MockCommandEngine:
     """Mock implementation of CommandEngine for testing."""
 
+    __slots__ = ("pending_commands", "all_commands", "_pool")
+
+    _RELEASABLE = frozenset(
+        {
+            CommandStatus.REJECTED,
+            CommandStatus.COMPLETED,
+            CommandStatus.FAILED,
+            CommandStatus.CANCELLED,
+        }
+    )
+
     def __init__(self):
         self.pending_commands: dict[UUID, Command] = {}
         self.all_commands: dict[UUID, Command] = {}
+        # Released commands, reused by propose_command instead of allocating
+        self._pool: list[Command] = []
 
     async def propose_command(
         self, project_id: UUID, command_text: str, ai_reasoning: str
     ) -> Command:
-        command = Command(
-            id=uuid4(),
-            project_id=project_id,
-            command_text=command_text,
-            ai_reasoning=ai_reasoning,
-            status=CommandStatus.PROPOSED,
-        )
+        if self._pool:
+            command = self._pool.pop()
+            command.id = _fast_uuid4()
+            command.project_id = project_id
+            command.command_text = command_text
+            command.ai_reasoning = ai_reasoning
+            command.status = CommandStatus.PROPOSED
+            command.result = None
+            command.timestamp = datetime.now()
+        else:
+            command = Command(
+                id=_fast_uuid4(),
+                project_id=project_id,
+                command_text=command_text,
+                ai_reasoning=ai_reasoning,
+                status=CommandStatus.PROPOSED,
+            )
         self.pending_commands[command.id] = command
         self.all_commands[command.id] = command
         return command
 
     async def approve_command(self, command_id: UUID) -> None:
-        if command_id not in self.pending_commands:
+        command = self.pending_commands.get(command_id)
+        if command is None:
             raise ValueError(f"Command {command_id} not found or not pending")
 
-        command = self.pending_commands[command_id]
-        if command.status != CommandStatus.PROPOSED:
+        if command.status is not CommandStatus.PROPOSED:
             raise ValueError(f"Command {command_id} is not in PROPOSED state")
 
         command.status = CommandStatus.APPROVED
         del self.pending_commands[command_id]
 
     async def reject_command(self, command_id: UUID) -> None:
-        if command_id not in self.pending_commands:
+        command = self.pending_commands.get(command_id)
+        if command is None:
             raise ValueError(f"Command {command_id} not found or not pending")
 
-        command = self.pending_commands[command_id]
-        if command.status != CommandStatus.PROPOSED:
+        if command.status is not CommandStatus.PROPOSED:
             raise ValueError(f"Command {command_id} is not in PROPOSED state")
 
         command.status = CommandStatus.REJECTED
         del self.pending_commands[command_id]
 
     async def execute_command(self, command_id: UUID) -> None:
-        if command_id not in self.all_commands:
+        command = self.all_commands.get(command_id)
+        if command is None:
             raise ValueError(f"Command {command_id} not found")
 
-        command = self.all_commands[command_id]
-        if command.status != CommandStatus.APPROVED:
+        if command.status is not CommandStatus.APPROVED:
             raise ValueError(f"Command {command_id} is not APPROVED")
 
-        command.status = CommandStatus.EXECUTING
-        # Simulate execution
+        # Simulated execution completes immediately, so EXECUTING is never observable
         command.status = CommandStatus.COMPLETED
         command.result = CommandResult(
             exit_code=0,
@@ -215,15 +289,28 @@ class MockCommandEngine:
             execution_time=1.0,
         )
 
+    def release(self, command_id: UUID) -> None:
+        """Return a finished command to the pool; callers must drop references."""
+        command = self.all_commands.get(command_id)
+        if command is None:
+            raise ValueError(f"Command {command_id} not found")
+
+        if command.status not in self._RELEASABLE:
+            raise ValueError(f"Command {command_id} is not finished")
+
+        del self.all_commands[command_id]
+        self._pool.append(command)
+
     def get_pending_commands(self) -> dict[UUID, Command]:
+        # Snapshot, as in CommandEngine, so callers can approve while iterating
         return self.pending_commands.copy()
 
     async def cancel_execution(self, command_id: UUID) -> None:
-        if command_id not in self.all_commands:
+        command = self.all_commands.get(command_id)
+        if command is None:
             raise ValueError(f"Command {command_id} not found")
 
-        command = self.all_commands[command_id]
-        if command.status != CommandStatus.EXECUTING:
+        if command.status is not CommandStatus.EXECUTING:
             raise ValueError(f"Command {command_id} is not EXECUTING")
 
         command.status = CommandStatus.FAILED
@@ -232,49 +319,102 @@ class MockCommandEngine:
 class MockStateManager:
     """Mock implementation of StateManager for testing."""
 
+    __slots__ = ("state", "subscribers", "_snapshot")
+
     def __init__(self):
         self.state = ApplicationState()
-        self.subscribers = []
+        self.subscribers: dict[
+            Callable[[ApplicationState], None], Callable[[ApplicationState], None]
+        ] = {}
+        self._snapshot: tuple[Callable[[ApplicationState], None], ...] = ()
 
     def get_state(self) -> ApplicationState:
         return self.state
 
     async def update_state(self, updates: dict[str, any]) -> None:
+        changed = False
         for key, value in updates.items():
-            if hasattr(self.state, key):
-                setattr(self.state, key, value)
-            else:
+            if not hasattr(self.state, key):
                 raise ValueError(f"Invalid state field: {key}")
+            if getattr(self.state, key) is not value:
+                setattr(self.state, key, value)
+                changed = True
 
-        # Notify subscribers
-        for callback in self.subscribers:
-            callback(self.state)
+        # Notify subscribers only if something was actually reassigned
+        if changed:
+            self._notify()
 
     async def toggle_autopilot(self) -> bool:
         self.state.autopilot_enabled = not self.state.autopilot_enabled
-        for callback in self.subscribers:
-            callback(self.state)
+        self._notify()
         return self.state.autopilot_enabled
 
     async def set_ai_model(self, model: str) -> None:
-        valid_models = [
-            AIModel.GEMINI_FLASH,
-            AIModel.GEMINI_PRO,
-            AIModel.GEMINI_FLASH_8B,
-        ]
-        if model not in valid_models:
+        if model not in _VALID_MODELS:
             raise ValueError(f"Invalid model: {model}")
 
         self.state.selected_ai_model = model
-        for callback in self.subscribers:
-            callback(self.state)
+        self._notify()
 
     def subscribe(self, callback: Callable[[ApplicationState], None]) -> None:
-        self.subscribers.append(callback)
+        # Keyed by the callable itself: bound methods are recreated on every
+        # attribute access but compare and hash equal
+        self.subscribers[callback] = callback
+        self._snapshot = tuple(self.subscribers.values())
 
     def unsubscribe(self, callback: Callable[[ApplicationState], None]) -> None:
-        if callback in self.subscribers:
-            self.subscribers.remove(callback)
+        if self.subscribers.pop(callback, None) is not None:
+            self._snapshot = tuple(self.subscribers.values())
+
+    def _notify(self) -> None:
+        # Call every subscriber from C via map(); a zero-length deque consumes
+        # the iterator without building a result list
+        deque(map(methodcaller("__call__", self.state), self._snapshot), maxlen=0)
+
+
+_PROJECT_SERVICE_METHODS = frozenset(
+    {
+        "create_project",
+        "get_project",
+        "list_projects",
+        "update_project",
+        "delete_project",
+        "get_current_project",
+        "set_current_project",
+    }
+)
+_CONTEXT_SERVICE_METHODS = frozenset(
+    {
+        "save_context",
+        "load_context",
+        "append_command",
+        "get_command_history",
+        "update_command_status",
+    }
+)
+_AI_ORCHESTRATOR_METHODS = frozenset(
+    {"generate_command", "analyze_result", "get_available_models", "estimate_tokens"}
+)
+_COMMAND_ENGINE_METHODS = frozenset(
+    {
+        "propose_command",
+        "approve_command",
+        "reject_command",
+        "execute_command",
+        "get_pending_commands",
+        "cancel_execution",
+    }
+)
+_STATE_MANAGER_METHODS = frozenset(
+    {
+        "get_state",
+        "update_state",
+        "toggle_autopilot",
+        "set_ai_model",
+        "subscribe",
+        "unsubscribe",
+    }
+)
 
 
 class TestServiceInterfaces:
@@ -287,54 +427,41 @@ class TestServiceInterfaces:
         assert isinstance(service, object)  # Basic runtime check
 
         # Verify all required methods exist
-        assert hasattr(service, "create_project")
-        assert hasattr(service, "get_project")
-        assert hasattr(service, "list_projects")
-        assert hasattr(service, "update_project")
-        assert hasattr(service, "delete_project")
-        assert hasattr(service, "get_current_project")
-        assert hasattr(service, "set_current_project")
+        assert _PROJECT_SERVICE_METHODS <= set(dir(service))
 
     def test_context_service_protocol(self) -> None:
         """Test that MockContextService implements ContextService protocol."""
         service = MockContextService()
 
-        assert hasattr(service, "save_context")
-        assert hasattr(service, "load_context")
-        assert hasattr(service, "append_command")
-        assert hasattr(service, "get_command_history")
-        assert hasattr(service, "update_command_status")
+        assert _CONTEXT_SERVICE_METHODS <= set(dir(service))
 
     def test_ai_orchestrator_protocol(self) -> None:
         """Test that MockAIOrchestrator implements AIOrchestrator protocol."""
         service = MockAIOrchestrator()
 
-        assert hasattr(service, "generate_command")
-        assert hasattr(service, "analyze_result")
-        assert hasattr(service, "get_available_models")
-        assert hasattr(service, "estimate_tokens")
+        assert _AI_ORCHESTRATOR_METHODS <= set(dir(service))
 
     def test_command_engine_protocol(self) -> None:
         """Test that MockCommandEngine implements CommandEngine protocol."""
         service = MockCommandEngine()
 
-        assert hasattr(service, "propose_command")
-        assert hasattr(service, "approve_command")
-        assert hasattr(service, "reject_command")
-        assert hasattr(service, "execute_command")
-        assert hasattr(service, "get_pending_commands")
-        assert hasattr(service, "cancel_execution")
+        assert _COMMAND_ENGINE_METHODS <= set(dir(service))
 
     def test_state_manager_protocol(self) -> None:
         """Test that MockStateManager implements StateManager protocol."""
         service = MockStateManager()
 
-        assert hasattr(service, "get_state")
-        assert hasattr(service, "update_state")
-        assert hasattr(service, "toggle_autopilot")
-        assert hasattr(service, "set_ai_model")
-        assert hasattr(service, "subscribe")
-        assert hasattr(service, "unsubscribe")
+        assert _STATE_MANAGER_METHODS <= set(dir(service))
+
+
+class _StateListener:
+    """Records autopilot changes through a bound-method callback."""
+
+    def __init__(self) -> None:
+        self.changes: list[bool] = []
+
+    def on_change(self, state: ApplicationState) -> None:
+        self.changes.append(state.autopilot_enabled)
 
 
 class TestMockImplementations:
@@ -375,6 +502,33 @@ class TestMockImplementations:
         projects = await service.list_projects()
         assert len(projects) == 0
 
+    @pytest.mark.asyncio
+    async def test_context_service_updates_directly_appended_command(self) -> None:
+        """Test status updates for commands appended to a loaded context."""
+        service = MockContextService()
+        project_id = uuid4()
+        await service.save_context(project_id, ProjectContext())
+
+        command = Command(
+            id=uuid4(),
+            project_id=project_id,
+            command_text="git init",
+            ai_reasoning="Initialize repository",
+            status=CommandStatus.PROPOSED,
+        )
+        context = await service.load_context(project_id)
+        context.history.append(command)
+
+        await service.update_command_status(
+            project_id, command.id, CommandStatus.APPROVED
+        )
+        assert command.status == CommandStatus.APPROVED
+
+        with pytest.raises(ValueError, match="not found"):
+            await service.update_command_status(
+                project_id, uuid4(), CommandStatus.APPROVED
+            )
+
     @pytest.mark.asyncio
     async def test_command_engine_workflow(self) -> None:
         """Test complete command engine workflow."""
@@ -395,6 +549,7 @@ class TestMockImplementations:
         # Approve command
         await engine.approve_command(command.id)
         assert command.status == CommandStatus.APPROVED
+        assert pending == {command.id: command}  # Snapshot is unaffected
 
         # Execute command
         await engine.execute_command(command.id)
@@ -402,6 +557,35 @@ class TestMockImplementations:
         assert command.result is not None
         assert command.result.exit_code == 0
 
+    @pytest.mark.asyncio
+    async def test_command_engine_reuses_released_command(self) -> None:
+        """Test that a released command is fully reset when proposed again."""
+        engine = MockCommandEngine()
+        command = await engine.propose_command(uuid4(), "git init", "Initialize")
+        old_id = command.id
+        await engine.approve_command(command.id)
+        await engine.execute_command(command.id)
+        command.timestamp = datetime(2000, 1, 1)
+
+        engine.release(command.id)
+        assert old_id not in engine.all_commands
+
+        # The pool belongs to this engine only
+        other = await MockCommandEngine().propose_command(uuid4(), "ls", "List")
+        assert other is not command
+
+        project_id = uuid4()
+        reused = await engine.propose_command(project_id, "git status", "Check")
+        assert reused is command
+        assert reused.id != old_id
+        assert reused.project_id == project_id
+        assert reused.command_text == "git status"
+        assert reused.ai_reasoning == "Check"
+        assert reused.status == CommandStatus.PROPOSED
+        assert reused.result is None
+        assert reused.timestamp > datetime(2000, 1, 1)
+        assert engine.get_pending_commands() == {reused.id: reused}
+
     @pytest.mark.asyncio
     async def test_state_manager_subscriptions(self) -> None:
         """Test state manager subscription mechanism."""
@@ -429,6 +613,21 @@ class TestMockImplementations:
         await manager.toggle_autopilot()
         assert len(state_changes) == 2  # No new updates
 
+    @pytest.mark.asyncio
+    async def test_state_manager_unsubscribe_bound_method(self) -> None:
+        """Test that a bound method can be unsubscribed via a fresh access."""
+        manager = MockStateManager()
+        listener = _StateListener()
+
+        manager.subscribe(listener.on_change)
+        await manager.toggle_autopilot()
+        assert listener.changes == [True]
+
+        manager.unsubscribe(listener.on_change)
+        await manager.toggle_autopilot()
+        assert listener.changes == [True]
+        assert not manager.subscribers
+
 
 class TestAIIntegration:
     """Test AI orchestrator integration scenarios."""
@@ -1,6 +1,7 @@
 """Unit tests for orchestration data models."""
 
 import pytest
+from dataclasses import fields
 from datetime import datetime, timedelta
 from pathlib import Path
 from uuid import uuid4
@@ -307,4 +308,20 @@ def test_pattern_reliability_score():
     
     # Heavily used pattern
     veteran_pattern = Pattern(success_rate=0.9, usage_count=20)
-    assert veteran_pattern.reliability_score == pytest.approx(0.9 * 0.7 + 1.0 * 0.3)
\ No newline at end of file
+    assert veteran_pattern.reliability_score == pytest.approx(0.9 * 0.7 + 1.0 * 0.3)
+
+
+def test_pattern_reliability_score_updates():
+    """Test that the cached reliability score follows its inputs."""
+    pattern = Pattern(success_rate=0.8)
+    assert pattern.reliability_score == pytest.approx(0.56)
+    
+    pattern.success_rate = 0.5
+    assert pattern.reliability_score == pytest.approx(0.35)
+    
+    pattern.use()
+    assert pattern.reliability_score == pytest.approx(0.5 * 0.7 + 0.1 * 0.3)
+    
+    # The cache is not part of the dataclass fields
+    assert "success_rate" in {f.name for f in fields(Pattern)}
+    assert not any(f.name.startswith("_") for f in fields(Pattern))
\ No newline at end of file
@@ -2,17 +2,60 @@
 
 import asyncio
 import pytest
+from itertools import repeat
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
-from uuid import uuid4
+from uuid import UUID
 
 from imthedev.core.services.claude_executor import ClaudeCodeExecutor
+from imthedev.core.services.sc_parsing import validation_error
 from imthedev.core.orchestration.models import TestResults
 
+pytestmark = [
+    pytest.mark.asyncio(loop_scope="module"),
+    # The module-wide mark also reaches the synchronous tests here
+    pytest.mark.filterwarnings(
+        "ignore:The test <Function .*> is marked with '@pytest.mark.asyncio'"
+    ),
+]
 
-@pytest.fixture
+
+class FakeStream:
+    """Stand-in for a subprocess stdout stream that replays byte chunks."""
+    
+    def __init__(self, chunks=(), read_delay=0.0):
+        self._chunks = iter(chunks)
+        self._read_delay = read_delay
+    
+    async def read(self, n=-1):
+        if self._read_delay:
+            await asyncio.sleep(self._read_delay)
+        return next(self._chunks, b"")
+
+
+class FakeProcess:
+    """Stand-in for asyncio.subprocess.Process that records termination."""
+    
+    def __init__(self, chunks=(), returncode=0, read_delay=0.0):
+        self.stdout = FakeStream(chunks, read_delay)
+        self.stderr = FakeStream()
+        self.returncode = returncode
+        self.terminate_calls = 0
+        self.kill_calls = 0
+    
+    async def wait(self):
+        return self.returncode
+    
+    def terminate(self):
+        self.terminate_calls += 1
+    
+    def kill(self):
+        self.kill_calls += 1
+
+
+@pytest.fixture(scope="module")
 def executor():
-    """Create a Claude Code executor for testing."""
+    """Create a Claude Code executor shared by the tests in this module."""
     return ClaudeCodeExecutor(
         claude_binary="claude",
         working_directory=Path("/tmp/test"),
@@ -20,7 +63,14 @@ def executor():
     )
 
 
-@pytest.mark.asyncio
+@pytest.fixture(autouse=True)
+def reset_executor(executor):
+    """Reset the per-execution state of the shared executor before each test."""
+    executor.current_process = None
+    executor.execution_id = None
+    executor.default_timeout = 10.0
+
+
 async def test_validate_command_valid(executor):
     """Test validating valid SC commands."""
     # Valid commands
@@ -35,7 +85,6 @@ async def test_validate_command_valid(executor):
     )
 
 
-@pytest.mark.asyncio
 async def test_validate_command_invalid(executor):
     """Test rejecting invalid SC commands."""
     # Invalid command format
@@ -52,6 +101,16 @@ async def test_validate_command_invalid(executor):
     assert not await executor.validate_command("/sc:build --not-a-real-flag")
 
 
+async def test_validate_command_cached(executor):
+    """Test that repeated validation of a command hits the cache."""
+    command = "/sc:improve --persona-refactorer --uc"
+    assert await executor.validate_command(command)
+    hits = validation_error.cache_info().hits
+    
+    assert await executor.validate_command(command)
+    assert validation_error.cache_info().hits == hits + 1
+
+
 def test_extract_command_type(executor):
     """Test extracting command type from SC commands."""
     assert executor._extract_command_type("/sc:test") == "test"
@@ -137,7 +196,6 @@ def test_parse_progress(executor):
     assert progress3 is None
 
 
-@pytest.mark.asyncio
 async def test_extract_metadata(executor):
     """Test extracting SCF metadata from output."""
     output = """
@@ -160,28 +218,25 @@ async def test_extract_metadata(executor):
     assert metadata.has_enhanced_features()
 
 
-@pytest.mark.asyncio
+async def test_extract_metadata_flag_with_metric(executor):
+    """Test that a flag followed by a value is recorded as flag and metric."""
+    metadata = await executor.extract_metadata("Limits: --timeout: 30s --max-load: 75%")
+    
+    assert {"timeout", "max-load"} <= set(metadata.flags_used)
+    assert metadata.performance_metrics == {"timeout": 30000.0, "load": 0.75}
+
+
 async def test_execute_command_mock(executor):
     """Test command execution with mocked subprocess."""
-    with patch('asyncio.create_subprocess_shell') as mock_subprocess:
-        # Create mock process
-        mock_process = AsyncMock()
-        mock_process.stdout.readline = AsyncMock()
-        mock_process.stderr.readline = AsyncMock()
-        mock_process.wait = AsyncMock(return_value=0)
-        
-        # Set up readline to return output then empty
-        outputs = [
-            b"Starting execution\n",
-            b"Progress: 50% - Working\n",
-            b"Tests: 5 passed, 0 failed, 0 skipped\n",
-            b"Complete\n",
-            b""  # End of output
-        ]
-        mock_process.stdout.readline.side_effect = outputs
-        
-        mock_subprocess.return_value = mock_process
-        
+    # Output arrives in chunks, with a line split across several of them
+    process = FakeProcess([
+        b"Starting execution\nProgress: 50% - Working\n",
+        b"Tests: 5 passed, 0 failed, 0 skipped\nCo",
+        b"mp",
+        b"lete\n",
+    ])
+    
+    with patch('asyncio.create_subprocess_shell', return_value=process) as mock_subprocess:
         # Execute command
         output_lines = []
         async for line in executor.execute_command("/sc:test"):
@@ -200,54 +255,37 @@ async def test_execute_command_mock(executor):
         assert "test" in call_args
 
 
-@pytest.mark.asyncio
 async def test_execute_command_timeout(executor):
     """Test command execution timeout."""
     executor.default_timeout = 0.01  # Very short timeout
     
-    with patch('asyncio.create_subprocess_shell') as mock_subprocess:
-        # Create mock process that never completes
-        mock_process = AsyncMock()
-        mock_process.stdout.readline = AsyncMock()
-        
-        # Simulate slow output
-        async def slow_readline():
-            await asyncio.sleep(1.0)  # Longer than timeout
-            return b"output\n"
-        
-        mock_process.stdout.readline.side_effect = slow_readline
-        mock_process.wait = AsyncMock()
-        mock_subprocess.return_value = mock_process
-        
+    # Process that keeps producing output slower than the timeout
+    process = FakeProcess(repeat(b"output\n"), read_delay=0.05)
+    
+    with patch('asyncio.create_subprocess_shell', return_value=process):
         # Should timeout
         with pytest.raises(asyncio.TimeoutError):
             async for _ in executor.execute_command("/sc:test", timeout=0.01):
                 pass
+    
+    assert process.terminate_calls == 1
 
 
-@pytest.mark.asyncio
 async def test_cancel_execution(executor):
     """Test cancelling execution."""
-    with patch('asyncio.create_subprocess_shell') as mock_subprocess:
-        mock_process = AsyncMock()
-        mock_process.terminate = AsyncMock()
-        mock_process.kill = AsyncMock()
-        mock_process.wait = AsyncMock()
-        
-        mock_subprocess.return_value = mock_process
-        executor.current_process = mock_process
-        
-        # Cancel execution
-        await executor.cancel_execution()
-        
-        # Verify process was terminated
-        mock_process.terminate.assert_called_once()
+    process = FakeProcess()
+    executor.current_process = process
+    
+    # Cancel execution
+    await executor.cancel_execution()
+    
+    # Verify process was terminated
+    assert process.terminate_calls == 1
 
 
-@pytest.mark.asyncio
 async def test_parse_output_events(executor):
     """Test parsing special events from output."""
-    executor.execution_id = uuid4()
+    executor.execution_id = UUID(int=1)
     
     # Mock event bus
     with patch('imthedev.core.services.claude_executor.orchestration_bus') as mock_bus:
@@ -270,7 +308,6 @@ async def test_parse_output_events(executor):
         await executor._parse_output_events("Tests: 10 tests passed, 0 failed")
 
 
-@pytest.mark.asyncio
 async def test_get_execution_result_no_execution(executor):
     """Test getting execution result without active execution."""
     with pytest.raises(RuntimeError) as exc_info:
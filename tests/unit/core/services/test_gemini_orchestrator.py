@@ -3,8 +3,9 @@
 import asyncio
 import json
 import pytest
+from itertools import count
 from unittest.mock import AsyncMock, MagicMock, patch
-from uuid import uuid4
+from uuid import UUID
 
 from imthedev.core.orchestration.models import (
     OrchestrationObjective,
@@ -14,6 +15,15 @@ from imthedev.core.orchestration.models import (
 )
 from imthedev.core.services.gemini_orchestrator import GeminiOrchestrator
 
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+_ids = count(1)
+
+
+def _uid() -> UUID:
+    """Return a unique, deterministic UUID for test objectives."""
+    return UUID(int=next(_ids))
+
 
 class MockGeminiAdapter:
     """Mock Gemini adapter for testing."""
@@ -22,19 +32,29 @@ class MockGeminiAdapter:
         self.generate_content = AsyncMock()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_gemini_adapter():
-    """Create a mock Gemini adapter."""
+    """Create a mock Gemini adapter shared by the tests in this module."""
     return MockGeminiAdapter()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def orchestrator(mock_gemini_adapter):
     """Create a Gemini orchestrator with mock adapter."""
     return GeminiOrchestrator(gemini_adapter=mock_gemini_adapter)
 
 
-@pytest.mark.asyncio
+@pytest.fixture(autouse=True)
+def reset_orchestrator(orchestrator, mock_gemini_adapter):
+    """Clear learned patterns and mock responses before each test."""
+    orchestrator.context_manager = None
+    orchestrator.patterns.clear()
+    orchestrator._plan_cache.clear()
+    mock_gemini_adapter.generate_content.reset_mock(
+        return_value=True, side_effect=True
+    )
+
+
 async def test_analyze_objective(orchestrator, mock_gemini_adapter):
     """Test analyzing an objective."""
     objective = OrchestrationObjective(
@@ -76,7 +96,71 @@ async def test_analyze_objective(orchestrator, mock_gemini_adapter):
     mock_gemini_adapter.generate_content.assert_called_once()
 
 
-@pytest.mark.asyncio
+async def test_analyze_objective_cached(orchestrator, mock_gemini_adapter):
+    """Test that an equivalent objective reuses the cached plan."""
+    mock_gemini_adapter.generate_content.return_value = json.dumps({
+        "complexity": 0.4,
+        "steps": [{"command": "/sc:implement api", "description": "Build API"}],
+    })
+    
+    first = await orchestrator.analyze_objective(
+        OrchestrationObjective(description="Build the REST API", success_criteria=["Tests pass"])
+    )
+    second_objective = OrchestrationObjective(
+        description="Build  the REST\tAPI ", success_criteria=["Tests pass"]
+    )
+    second = await orchestrator.analyze_objective(second_objective)
+    
+    mock_gemini_adapter.generate_content.assert_called_once()
+    assert second.objective_id == second_objective.id
+    assert second.steps == first.steps
+    
+    # Each caller gets its own copy of the cached plan
+    second.add_step("/sc:test", "Run tests")
+    assert first.total_steps == 1
+
+
+async def test_analyze_objective_cache_distinguishes_objectives(
+    orchestrator, mock_gemini_adapter
+):
+    """Test that objectives with different prompt inputs do not share a plan."""
+    mock_gemini_adapter.generate_content.side_effect = lambda prompt: json.dumps(
+        {"steps": [{"command": "/sc:implement", "description": prompt}]}
+    )
+    pattern = Pattern(
+        name="Rename Pattern",
+        trigger="rename",
+        command_sequence=["/sc:improve"],
+        success_rate=0.9,
+    )
+    orchestrator.patterns.append(pattern)
+    
+    objectives = [
+        ("Port the parser to C++", []),
+        ("Port the parser to C#", []),
+        ("Port the parser to C", []),
+        ("Rename Config to config", ["Imports updated", "Tests pass"]),
+        ("Rename config to Config", ["Imports updated", "Tests pass"]),
+        ("Rename config to Config", ["Tests pass", "Imports updated"]),
+    ]
+    for description, criteria in objectives:
+        await orchestrator.analyze_objective(
+            OrchestrationObjective(description=description, success_criteria=criteria)
+        )
+    assert mock_gemini_adapter.generate_content.call_count == len(objectives)
+    
+    # Changed pattern details change the prompt, so the cached plan is not reused
+    pattern.command_sequence = ["/sc:improve", "/sc:test"]
+    await orchestrator.analyze_objective(
+        OrchestrationObjective(description="Rename config to Config")
+    )
+    pattern.success_rate = 0.5
+    await orchestrator.analyze_objective(
+        OrchestrationObjective(description="Rename config to Config")
+    )
+    assert mock_gemini_adapter.generate_content.call_count == len(objectives) + 2
+
+
 async def test_analyze_objective_with_pattern(orchestrator, mock_gemini_adapter):
     """Test analyzing objective with matching pattern."""
     # Add a pattern
@@ -108,10 +192,9 @@ async def test_analyze_objective_with_pattern(orchestrator, mock_gemini_adapter)
     assert "95.0%" in call_args
 
 
-@pytest.mark.asyncio
 async def test_propose_command(orchestrator, mock_gemini_adapter):
     """Test proposing a SuperClaude command."""
-    context = OrchestrationContext(objective_id=uuid4())
+    context = OrchestrationContext(objective_id=_uid())
     context.add_command("/sc:analyze", success=True)
     
     # Mock response
@@ -135,7 +218,110 @@ async def test_propose_command(orchestrator, mock_gemini_adapter):
     assert proposal.is_high_confidence()
 
 
-@pytest.mark.asyncio
+async def test_propose_command_coalesces_identical_requests(orchestrator, mock_gemini_adapter):
+    """Test that concurrent identical prompts share one Gemini call."""
+    context = OrchestrationContext(objective_id=_uid())
+    response = json.dumps({
+        "command": "/sc:test --with-tests",
+        "reasoning": "Verify the change",
+        "confidence": 0.8,
+    })
+    
+    # Yield once so the second caller arrives while the first is in flight
+    async def slow_response(prompt):
+        await asyncio.sleep(0)
+        return response
+    
+    mock_gemini_adapter.generate_content.side_effect = slow_response
+    
+    first, second = await asyncio.gather(
+        orchestrator.propose_command(context, "Run tests"),
+        orchestrator.propose_command(context, "Run tests"),
+    )
+    
+    assert first.command == second.command == "/sc:test --with-tests"
+    mock_gemini_adapter.generate_content.assert_called_once()
+    
+    # Later requests are sent again rather than served from a stale result
+    await orchestrator.propose_command(context, "Run tests")
+    assert mock_gemini_adapter.generate_content.call_count == 2
+
+
+async def test_propose_command_survives_leader_cancellation(
+    orchestrator, mock_gemini_adapter
+):
+    """Test that cancelling the first caller does not cancel coalesced ones."""
+    context = OrchestrationContext(objective_id=_uid())
+    response = json.dumps({
+        "command": "/sc:test --with-tests",
+        "reasoning": "Verify the change",
+        "confidence": 0.8,
+    })
+    
+    # The first request hangs until its caller is cancelled
+    async def hang_first(prompt):
+        if mock_gemini_adapter.generate_content.call_count == 1:
+            await asyncio.Event().wait()
+        return response
+    
+    mock_gemini_adapter.generate_content.side_effect = hang_first
+    
+    leader = asyncio.create_task(orchestrator.propose_command(context, "Run tests"))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(orchestrator.propose_command(context, "Run tests"))
+    await asyncio.sleep(0)
+    
+    leader.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    
+    proposal = await follower
+    assert not follower.cancelled()
+    assert proposal.command == "/sc:test --with-tests"
+    assert mock_gemini_adapter.generate_content.call_count == 2
+    assert not orchestrator._inflight
+
+
+async def test_propose_command_survives_leader_base_exception(
+    orchestrator, mock_gemini_adapter
+):
+    """Test that a leader aborted by a BaseException does not strand followers."""
+    context = OrchestrationContext(objective_id=_uid())
+    response = json.dumps({
+        "command": "/sc:test --with-tests",
+        "reasoning": "Verify the change",
+        "confidence": 0.8,
+    })
+    
+    class Abort(BaseException):
+        """Stands in for KeyboardInterrupt without stopping the event loop."""
+    
+    release = asyncio.Event()
+    
+    # The first request is aborted once the follower is waiting on it
+    async def abort_first(prompt):
+        if mock_gemini_adapter.generate_content.call_count == 1:
+            await release.wait()
+            raise Abort
+        return response
+    
+    mock_gemini_adapter.generate_content.side_effect = abort_first
+    
+    leader = asyncio.create_task(orchestrator.propose_command(context, "Run tests"))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(orchestrator.propose_command(context, "Run tests"))
+    await asyncio.sleep(0)
+    
+    release.set()
+    with pytest.raises(Abort):
+        await leader
+    
+    proposal = await asyncio.wait_for(follower, timeout=1)
+    assert proposal.command == "/sc:test --with-tests"
+    assert mock_gemini_adapter.generate_content.call_count == 2
+    assert not orchestrator._inflight
+
+
 async def test_analyze_execution_result_success(orchestrator, mock_gemini_adapter):
     """Test analyzing successful execution result."""
     result = ExecutionResult(
@@ -144,7 +330,7 @@ async def test_analyze_execution_result_success(orchestrator, mock_gemini_adapte
         stdout="All tests passed",
         execution_time=5.0
     )
-    context = OrchestrationContext(objective_id=uuid4())
+    context = OrchestrationContext(objective_id=_uid())
     
     # Mock response
     mock_response = json.dumps({
@@ -172,7 +358,6 @@ async def test_analyze_execution_result_success(orchestrator, mock_gemini_adapte
     assert analysis.is_actionable()
 
 
-@pytest.mark.asyncio
 async def test_analyze_execution_result_failure(orchestrator, mock_gemini_adapter):
     """Test analyzing failed execution result."""
     result = ExecutionResult(
@@ -180,7 +365,7 @@ async def test_analyze_execution_result_failure(orchestrator, mock_gemini_adapte
         exit_code=1,
         stderr="Test failed: ImportError"
     )
-    context = OrchestrationContext(objective_id=uuid4())
+    context = OrchestrationContext(objective_id=_uid())
     
     # Mock response
     mock_response = json.dumps({
@@ -205,7 +390,6 @@ async def test_analyze_execution_result_failure(orchestrator, mock_gemini_adapte
     assert "pytest module" in analysis.missing_elements
 
 
-@pytest.mark.asyncio
 async def test_determine_next_step_continue(orchestrator, mock_gemini_adapter):
     """Test determining next step when can continue."""
     from imthedev.core.orchestration.models import GeminiAnalysis
@@ -215,7 +399,7 @@ async def test_determine_next_step_continue(orchestrator, mock_gemini_adapter):
         can_continue=True,
         next_action="Add documentation"
     )
-    context = OrchestrationContext(objective_id=uuid4())
+    context = OrchestrationContext(objective_id=_uid())
     context.current_step = 2
     context.total_steps = 5
     
@@ -237,7 +421,6 @@ async def test_determine_next_step_continue(orchestrator, mock_gemini_adapter):
     assert proposal.command == "/sc:document --comprehensive"
 
 
-@pytest.mark.asyncio
 async def test_determine_next_step_complete(orchestrator, mock_gemini_adapter):
     """Test determining next step when objective is complete."""
     from imthedev.core.orchestration.models import GeminiAnalysis
@@ -246,7 +429,7 @@ async def test_determine_next_step_complete(orchestrator, mock_gemini_adapter):
         success=True,
         can_continue=False
     )
-    context = OrchestrationContext(objective_id=uuid4())
+    context = OrchestrationContext(objective_id=_uid())
     
     # Determine next step
     proposal = await orchestrator.determine_next_step(analysis, context)
@@ -255,7 +438,6 @@ async def test_determine_next_step_complete(orchestrator, mock_gemini_adapter):
     assert proposal is None
 
 
-@pytest.mark.asyncio
 async def test_propose_recovery(orchestrator, mock_gemini_adapter):
     """Test proposing recovery strategy."""
     from imthedev.core.orchestration.models import GeminiAnalysis
@@ -265,7 +447,7 @@ async def test_propose_recovery(orchestrator, mock_gemini_adapter):
         understanding="Database connection failed",
         requires_correction=True
     )
-    context = OrchestrationContext(objective_id=uuid4())
+    context = OrchestrationContext(objective_id=_uid())
     context.add_command("/sc:test db", success=False)
     
     # Mock response
@@ -286,7 +468,6 @@ async def test_propose_recovery(orchestrator, mock_gemini_adapter):
     assert "database connection" in proposal.reasoning.lower()
 
 
-@pytest.mark.asyncio
 async def test_error_handling_in_analyze(orchestrator, mock_gemini_adapter):
     """Test error handling when Gemini fails."""
     objective = OrchestrationObjective(description="Test")
@@ -301,7 +482,6 @@ async def test_error_handling_in_analyze(orchestrator, mock_gemini_adapter):
     assert "API Error" in str(exc_info.value)
 
 
-@pytest.mark.asyncio
 async def test_json_parse_error_fallback(orchestrator, mock_gemini_adapter):
     """Test fallback when JSON parsing fails."""
     context = OrchestrationContext()
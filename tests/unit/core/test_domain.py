@@ -1,8 +1,12 @@
 """Unit tests for core domain models."""
 
+from collections.abc import Callable
 from datetime import datetime
+from itertools import count
 from pathlib import Path
-from uuid import UUID, uuid4
+from uuid import UUID
+
+import pytest
 
 from imthedev.core.domain import (
     Command,
@@ -13,18 +17,36 @@ from imthedev.core.domain import (
     ProjectSettings,
 )
 
+_UUID_COUNTER = count(1)
+
+# Fixed values for tests where only the type of the field matters
+_FIXED_TS = datetime(2024, 1, 1)
+_FIXED_PATH = Path("/tmp/integration")
+
+
+def _uid() -> UUID:
+    """Return a unique, deterministic UUID without drawing from os.urandom."""
+    return UUID(int=next(_UUID_COUNTER))
+
 
 class TestCommandStatus:
     """Test the CommandStatus enum."""
 
-    def test_command_status_values(self) -> None:
+    @pytest.mark.parametrize(
+        ("member", "value"),
+        [
+            (CommandStatus.PROPOSED, "proposed"),
+            (CommandStatus.APPROVED, "approved"),
+            (CommandStatus.REJECTED, "rejected"),
+            (CommandStatus.EXECUTING, "executing"),
+            (CommandStatus.COMPLETED, "completed"),
+            (CommandStatus.FAILED, "failed"),
+            (CommandStatus.CANCELLED, "cancelled"),
+        ],
+    )
+    def test_command_status_values(self, member: CommandStatus, value: str) -> None:
         """Test that all expected status values exist."""
-        assert CommandStatus.PROPOSED.value == "proposed"
-        assert CommandStatus.APPROVED.value == "approved"
-        assert CommandStatus.REJECTED.value == "rejected"
-        assert CommandStatus.EXECUTING.value == "executing"
-        assert CommandStatus.COMPLETED.value == "completed"
-        assert CommandStatus.FAILED.value == "failed"
+        assert member.value == value
 
     def test_command_status_members(self) -> None:
         """Test that we can iterate over status values."""
@@ -37,29 +59,38 @@ class TestCommandStatus:
 class TestCommandResult:
     """Test the CommandResult dataclass."""
 
-    def test_command_result_creation(self) -> None:
-        """Test creating a CommandResult with all fields."""
+    @pytest.mark.parametrize(
+        ("exit_code", "stdout", "stderr", "execution_time"),
+        [
+            (0, "Success output", "", 1.5),
+            (1, "", "Error: Command not found", 0.1),
+        ],
+        ids=["success", "error"],
+    )
+    def test_command_result_creation(
+        self, exit_code: int, stdout: str, stderr: str, execution_time: float
+    ) -> None:
+        """Test creating a CommandResult for successful and failed commands."""
         result = CommandResult(
-            exit_code=0, stdout="Success output", stderr="", execution_time=1.5
+            exit_code=exit_code,
+            stdout=stdout,
+            stderr=stderr,
+            execution_time=execution_time,
         )
 
-        assert result.exit_code == 0
-        assert result.stdout == "Success output"
-        assert result.stderr == ""
-        assert result.execution_time == 1.5
-        assert isinstance(result.timestamp, datetime)
+        assert result.exit_code == exit_code
+        assert result.stdout == stdout
+        assert result.stderr == stderr
+        assert result.execution_time == execution_time
 
-    def test_command_result_with_error(self) -> None:
-        """Test creating a CommandResult for a failed command."""
-        result = CommandResult(
-            exit_code=1,
-            stdout="",
-            stderr="Error: Command not found",
-            execution_time=0.1,
-        )
+    def test_command_result_equality(self) -> None:
+        """Test that results compare by identity first, then field by field."""
+        result = CommandResult(0, "out", "", 0.5, timestamp=_FIXED_TS)
 
-        assert result.exit_code == 1
-        assert result.stderr == "Error: Command not found"
+        assert result == result
+        assert result == CommandResult(0, "out", "", 0.5, timestamp=_FIXED_TS)
+        assert result != CommandResult(1, "out", "", 0.5, timestamp=_FIXED_TS)
+        assert result != "out"
 
 
 class TestCommand:
@@ -67,9 +98,9 @@ class TestCommand:
 
     def test_command_creation(self) -> None:
         """Test creating a Command with required fields."""
-        project_id = uuid4()
+        project_id = _uid()
         command = Command(
-            id=uuid4(),
+            id=_uid(),
             project_id=project_id,
             command_text="git init",
             ai_reasoning="Initialize a new git repository",
@@ -82,7 +113,6 @@ class TestCommand:
         assert command.ai_reasoning == "Initialize a new git repository"
         assert command.status == CommandStatus.PROPOSED
         assert command.result is None
-        assert isinstance(command.timestamp, datetime)
 
     def test_command_with_result(self) -> None:
         """Test creating a Command with an execution result."""
@@ -94,8 +124,8 @@ class TestCommand:
         )
 
         command = Command(
-            id=uuid4(),
-            project_id=uuid4(),
+            id=_uid(),
+            project_id=_uid(),
             command_text="git init",
             ai_reasoning="Initialize repository",
             status=CommandStatus.COMPLETED,
@@ -123,8 +153,8 @@ class TestProjectContext:
         """Test creating a ProjectContext with command history."""
         commands = [
             Command(
-                id=uuid4(),
-                project_id=uuid4(),
+                id=_uid(),
+                project_id=_uid(),
                 command_text="mkdir src",
                 ai_reasoning="Create source directory",
                 status=CommandStatus.COMPLETED,
@@ -148,28 +178,43 @@ class TestProjectContext:
 class TestProjectSettings:
     """Test the ProjectSettings dataclass."""
 
-    def test_project_settings_defaults(self) -> None:
-        """Test creating ProjectSettings with default values."""
-        settings = ProjectSettings()
-
-        assert settings.auto_approve is False
-        assert settings.default_ai_model == "claude"
-        assert settings.command_timeout == 300
-        assert settings.environment_vars == {}
-
-    def test_project_settings_custom(self) -> None:
-        """Test creating ProjectSettings with custom values."""
-        settings = ProjectSettings(
-            auto_approve=True,
-            default_ai_model="gpt-4",
-            command_timeout=600,
-            environment_vars={"API_KEY": "test-key"},
-        )
-
-        assert settings.auto_approve is True
-        assert settings.default_ai_model == "gpt-4"
-        assert settings.command_timeout == 600
-        assert settings.environment_vars["API_KEY"] == "test-key"
+    @pytest.mark.parametrize(
+        ("kwargs", "expected"),
+        [
+            (
+                {},
+                {
+                    "auto_approve": False,
+                    "default_ai_model": "claude",
+                    "command_timeout": 300,
+                    "environment_vars": {},
+                },
+            ),
+            (
+                {
+                    "auto_approve": True,
+                    "default_ai_model": "gpt-4",
+                    "command_timeout": 600,
+                    "environment_vars": {"API_KEY": "test-key"},
+                },
+                {
+                    "auto_approve": True,
+                    "default_ai_model": "gpt-4",
+                    "command_timeout": 600,
+                    "environment_vars": {"API_KEY": "test-key"},
+                },
+            ),
+        ],
+        ids=["defaults", "custom"],
+    )
+    def test_project_settings(
+        self, kwargs: dict[str, object], expected: dict[str, object]
+    ) -> None:
+        """Test creating ProjectSettings with default and custom values."""
+        settings = ProjectSettings(**kwargs)
+
+        for name, value in expected.items():
+            assert getattr(settings, name) == value, name
 
 
 class TestProject:
@@ -177,7 +222,7 @@ class TestProject:
 
     def test_project_creation(self) -> None:
         """Test creating a Project with all required fields."""
-        project_id = uuid4()
+        project_id = _uid()
         path = Path("/home/user/projects/test")
         context = ProjectContext()
         settings = ProjectSettings()
@@ -186,7 +231,7 @@ class TestProject:
             id=project_id,
             name="Test Project",
             path=path,
-            created_at=datetime.now(),
+            created_at=_FIXED_TS,
             context=context,
             settings=settings,
         )
@@ -194,17 +239,17 @@ class TestProject:
         assert project.id == project_id
         assert project.name == "Test Project"
         assert project.path == path
-        assert isinstance(project.created_at, datetime)
+        assert project.created_at == _FIXED_TS
         assert project.context == context
         assert project.settings == settings
 
     def test_project_path_conversion(self) -> None:
         """Test that string paths are converted to Path objects."""
         project = Project(
-            id=uuid4(),
+            id=_uid(),
             name="Test",
             path="/home/user/project",  # String path
-            created_at=datetime.now(),
+            created_at=_FIXED_TS,
             context=ProjectContext(),
             settings=ProjectSettings(),
         )
@@ -220,7 +265,6 @@ class TestProject:
         assert isinstance(project.id, UUID)
         assert project.name == "New Project"
         assert project.path == path
-        assert isinstance(project.created_at, datetime)
         assert isinstance(project.context, ProjectContext)
         assert isinstance(project.settings, ProjectSettings)
         assert project.settings.auto_approve is False  # Default
@@ -238,16 +282,43 @@ class TestProject:
         assert project.settings.default_ai_model == "gpt-4"
 
 
+@pytest.mark.parametrize(
+    ("factory", "attribute"),
+    [
+        (lambda: CommandResult(0, "", "", 0.0), "timestamp"),
+        (lambda: Command(_uid(), _uid(), "", "", CommandStatus.PROPOSED), "timestamp"),
+        (lambda: Project.create(name="Timestamp", path=_FIXED_PATH), "created_at"),
+    ],
+    ids=["command_result", "command", "project"],
+)
+def test_timestamps_are_datetimes(
+    factory: Callable[[], object], attribute: str
+) -> None:
+    """Test that models get a datetime timestamp when none is given."""
+    assert isinstance(getattr(factory(), attribute), datetime)
+
+
+@pytest.mark.parametrize(
+    "model",
+    [CommandResult, Command, ProjectContext, ProjectSettings, Project],
+    ids=lambda model: model.__name__,
+)
+def test_domain_models_use_slots(model: type) -> None:
+    """Test that domain models store fields in slots instead of a __dict__."""
+    assert "__slots__" in model.__dict__
+    assert "__dict__" not in model.__dict__
+
+
 class TestDomainModelIntegration:
     """Integration tests for domain models working together."""
 
     def test_project_with_command_history(self) -> None:
         """Test a project with a full command history."""
-        project = Project.create(name="Integration Test", path=Path("/tmp/integration"))
+        project = Project.create(name="Integration Test", path=_FIXED_PATH)
 
         # Add commands to history
         command1 = Command(
-            id=uuid4(),
+            id=_uid(),
             project_id=project.id,
             command_text="git init",
             ai_reasoning="Initialize repository",
@@ -256,7 +327,7 @@ class TestDomainModelIntegration:
         )
 
         command2 = Command(
-            id=uuid4(),
+            id=_uid(),
             project_id=project.id,
             command_text="echo 'Hello World' > README.md",
             ai_reasoning="Create README file",
@@ -273,7 +344,7 @@ class TestDomainModelIntegration:
 
     def test_project_state_management(self) -> None:
         """Test managing project state through context."""
-        project = Project.create(name="State Test", path=Path("/tmp/state"))
+        project = Project.create(name="State Test", path=_FIXED_PATH)
 
         # Update project state
         project.context.current_state["git_initialized"] = True
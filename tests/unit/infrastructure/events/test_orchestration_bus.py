@@ -12,13 +12,29 @@ from imthedev.infrastructure.events import (
 )
 
 
-@pytest.fixture
+# The bus is shared across the module, so its tests must share one loop too
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+
+def high_confidence_filter(event: OrchestrationEvent) -> bool:
+    """Select events carrying a confidence above 0.5."""
+    return getattr(event, "confidence", 0.0) > 0.5
+
+
+@pytest.fixture(scope="module")
 def event_bus():
-    """Create a fresh event bus for testing."""
+    """Create one event bus shared by the tests in this module."""
     return OrchestrationEventBus()
 
 
-@pytest.mark.asyncio
+@pytest.fixture(autouse=True)
+def reset_event_bus(event_bus):
+    """Drop history and handlers so each test starts from an idle bus."""
+    yield
+    event_bus.clear_history()
+    event_bus.unsubscribe_all()
+
+
 async def test_event_subscription_and_emission(event_bus):
     """Test basic event subscription and emission."""
     received_events = []
@@ -37,8 +53,8 @@ async def test_event_subscription_and_emission(event_bus):
     )
     await event_bus.emit(test_event)
     
-    # Allow event processing
-    await asyncio.sleep(0.01)
+    # Wait for event processing
+    await event_bus.drain()
     
     # Check event was received
     assert len(received_events) == 1
@@ -46,19 +62,16 @@ async def test_event_subscription_and_emission(event_bus):
     assert received_events[0].confidence == 0.9
 
 
-@pytest.mark.asyncio
 async def test_multiple_handlers_same_event(event_bus):
     """Test multiple handlers for the same event type."""
-    handler1_called = False
-    handler2_called = False
+    handler1_calls = []
+    handler2_calls = []
     
     async def handler1(event: OrchestrationEvent):
-        nonlocal handler1_called
-        handler1_called = True
+        handler1_calls.append(event)
     
     async def handler2(event: OrchestrationEvent):
-        nonlocal handler2_called
-        handler2_called = True
+        handler2_calls.append(event)
     
     # Subscribe both handlers
     event_bus.subscribe(ExecutionStarted, handler1)
@@ -66,14 +79,13 @@ async def test_multiple_handlers_same_event(event_bus):
     
     # Emit event
     await event_bus.emit(ExecutionStarted(command="/sc:test"))
-    await asyncio.sleep(0.01)
+    await event_bus.drain()
     
     # Both handlers should be called
-    assert handler1_called
-    assert handler2_called
+    assert len(handler1_calls) == 1
+    assert len(handler2_calls) == 1
 
 
-@pytest.mark.asyncio
 async def test_event_inheritance_handling(event_bus):
     """Test that parent class handlers receive child events."""
     base_events = []
@@ -92,36 +104,33 @@ async def test_event_inheritance_handling(event_bus):
     # Emit specific event
     test_event = CommandProposed(command_text="/sc:test")
     await event_bus.emit(test_event)
-    await asyncio.sleep(0.01)
+    await event_bus.drain()
     
     # Both handlers should receive it
     assert len(base_events) == 1
     assert len(specific_events) == 1
 
 
-@pytest.mark.asyncio
 async def test_unsubscribe_handler(event_bus):
     """Test unsubscribing a handler."""
-    call_count = 0
+    calls = []
     
     async def handler(event: OrchestrationEvent):
-        nonlocal call_count
-        call_count += 1
+        calls.append(event)
     
     # Subscribe and emit
     event_bus.subscribe(CommandProposed, handler)
     await event_bus.emit(CommandProposed(command_text="/sc:test1"))
-    await asyncio.sleep(0.01)
-    assert call_count == 1
+    await event_bus.drain()
+    assert len(calls) == 1
     
     # Unsubscribe and emit again
     event_bus.unsubscribe(CommandProposed, handler)
     await event_bus.emit(CommandProposed(command_text="/sc:test2"))
-    await asyncio.sleep(0.01)
-    assert call_count == 1  # Should not increase
+    await event_bus.drain()
+    assert len(calls) == 1  # Should not increase
 
 
-@pytest.mark.asyncio
 async def test_event_history_and_replay(event_bus):
     """Test event history and replay functionality."""
     replayed_events = []
@@ -134,14 +143,14 @@ async def test_event_history_and_replay(event_bus):
     event2 = CommandProposed(command_text="/sc:test2", confidence=0.9)
     await event_bus.emit(event1)
     await event_bus.emit(event2)
-    await asyncio.sleep(0.01)
+    await event_bus.drain()
     
     # Subscribe handler after events were emitted
     event_bus.subscribe(CommandProposed, handler)
     
     # Replay events
     await event_bus.replay_events()
-    await asyncio.sleep(0.01)
+    await event_bus.drain()
     
     # Should receive both historical events
     assert len(replayed_events) == 2
@@ -149,7 +158,6 @@ async def test_event_history_and_replay(event_bus):
     assert replayed_events[1].command_text == "/sc:test2"
 
 
-@pytest.mark.asyncio
 async def test_event_replay_with_filter(event_bus):
     """Test replaying events with a filter function."""
     replayed_events = []
@@ -160,23 +168,19 @@ async def test_event_replay_with_filter(event_bus):
     # Emit events with different confidence levels
     await event_bus.emit(CommandProposed(command_text="/sc:low", confidence=0.3))
     await event_bus.emit(CommandProposed(command_text="/sc:high", confidence=0.9))
-    await asyncio.sleep(0.01)
+    await event_bus.drain()
     
     event_bus.subscribe(CommandProposed, handler)
     
     # Replay only high confidence events
-    def high_confidence_filter(event):
-        return hasattr(event, 'confidence') and event.confidence > 0.5
-    
     await event_bus.replay_events(high_confidence_filter)
-    await asyncio.sleep(0.01)
+    await event_bus.drain()
     
     # Should only receive high confidence event
     assert len(replayed_events) == 1
     assert replayed_events[0].command_text == "/sc:high"
 
 
-@pytest.mark.asyncio
 async def test_concurrent_event_processing(event_bus):
     """Test that events are processed concurrently."""
     processing_order = []
@@ -194,14 +198,13 @@ async def test_concurrent_event_processing(event_bus):
     
     # Emit event
     await event_bus.emit(OrchestrationEvent(metadata={"id": "1"}))
-    await asyncio.sleep(0.02)
+    await event_bus.drain()
     
     # Fast handler should complete first due to concurrent processing
     assert processing_order[0] == "fast-1"
     assert processing_order[1] == "slow-1"
 
 
-@pytest.mark.asyncio
 async def test_event_metrics(event_bus):
     """Test event bus metrics collection."""
     # Subscribe a handler
@@ -209,33 +212,34 @@ async def test_event_metrics(event_bus):
         await asyncio.sleep(0.001)
     
     event_bus.subscribe(OrchestrationEvent, handler)
+    before = event_bus.get_metrics()
     
     # Emit some events
-    for i in range(5):
-        await event_bus.emit(OrchestrationEvent(metadata={"id": i}))
+    await asyncio.gather(
+        *(event_bus.emit(OrchestrationEvent(metadata={"id": i})) for i in range(5))
+    )
     
-    await asyncio.sleep(0.02)
+    await event_bus.drain()
     
     # Check metrics
     metrics = event_bus.get_metrics()
-    assert metrics["events_processed"] == 5
-    assert metrics["events_failed"] == 0
+    # Counters are cumulative on the shared bus, so compare against the start
+    assert metrics["events_processed"] - before["events_processed"] == 5
+    assert metrics["events_failed"] == before["events_failed"]
     assert metrics["events_in_history"] == 5
     assert metrics["handlers_registered"] == 1
     assert metrics["average_processing_time"] > 0
 
 
-@pytest.mark.asyncio
 async def test_error_handling_in_handler(event_bus):
     """Test that errors in one handler don't affect others."""
-    successful_calls = 0
+    successful_calls = []
     
     async def failing_handler(event: OrchestrationEvent):
         raise ValueError("Handler error")
     
     async def working_handler(event: OrchestrationEvent):
-        nonlocal successful_calls
-        successful_calls += 1
+        successful_calls.append(event)
     
     # Subscribe both
     event_bus.subscribe(OrchestrationEvent, failing_handler)
@@ -243,20 +247,20 @@ async def test_error_handling_in_handler(event_bus):
     
     # Emit event
     await event_bus.emit(OrchestrationEvent())
-    await asyncio.sleep(0.01)
+    await event_bus.drain()
     
     # Working handler should still be called
-    assert successful_calls == 1
+    assert len(successful_calls) == 1
 
 
-@pytest.mark.asyncio
 async def test_clear_history(event_bus):
     """Test clearing event history."""
     # Emit some events
-    for i in range(3):
-        await event_bus.emit(OrchestrationEvent(metadata={"id": i}))
+    await asyncio.gather(
+        *(event_bus.emit(OrchestrationEvent(metadata={"id": i})) for i in range(3))
+    )
     
-    await asyncio.sleep(0.01)
+    await event_bus.drain()
     
     metrics = event_bus.get_metrics()
     assert metrics["events_in_history"] == 3
@@ -265,4 +269,25 @@ async def test_clear_history(event_bus):
     event_bus.clear_history()
     
     metrics = event_bus.get_metrics()
-    assert metrics["events_in_history"] == 0
\ No newline at end of file
+    assert metrics["events_in_history"] == 0
+
+
+async def test_drain_after_unsubscribe_all(event_bus):
+    """Test that unsubscribing everything does not abandon in-flight events."""
+    handled = []
+    
+    async def slow_handler(event: OrchestrationEvent):
+        await asyncio.sleep(0.01)
+        handled.append(event)
+    
+    event_bus.subscribe(OrchestrationEvent, slow_handler)
+    await event_bus.emit(OrchestrationEvent(metadata={"id": 1}))
+    await asyncio.sleep(0)
+    
+    event_bus.unsubscribe_all()
+    await event_bus.emit(OrchestrationEvent(metadata={"id": 2}))
+    await event_bus.drain()
+    
+    # The first event reached its handler before it was removed
+    assert len(handled) == 1
+    assert event_bus.get_metrics()["events_in_history"] == 2